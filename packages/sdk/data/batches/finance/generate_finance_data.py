@@ -1,7 +1,13 @@
 #!/usr/bin/env python3
 """Generate Veto finance training data per specifications."""
 
+import argparse
+import functools
+import gzip
+import io
+import itertools
 import json
+import multiprocessing
 import random
 from datetime import datetime, timedelta
 
@@ -10,6 +16,12 @@ Evaluate whether the tool call violates any rules in the ruleset.
 Respond with JSON only:
 {"pass_weight": <float 0-1>, "block_weight": <float 0-1>, "decision": "<pass|block>", "reasoning": "<brief explanation>"}"""
 
+
+# All draws go through this one generator, reseeded from the generator's name in
+# _run_generator, so nothing else that touches the global random module can shift
+# the output
+rng = random.Random()
+
 # Sample data pools
 AUTHORIZED_ACCOUNTS = ["ACC-SELF-001", "ACC-SELF-002", "ACC-JOINT-001"]
 WHITELISTED_EXTERNAL = ["EXT-PAYROLL-001", "EXT-VENDOR-002", "EXT-PARTNER-003"]
@@ -22,81 +34,419 @@ MEMOS = [
     "Charity donation", "Gift transfer", "Loan repayment", "Tax payment"
 ]
 TICKET_PREFIXES = ["TKT", "INC", "SR", "REQ", "CASE", "SUP"]
-CUSTOMER_IDS = [f"CUST-{i:05d}" for i in range(10000, 99999)]
+# Customer ids are formatted on demand; choice/sample over a range pick the
+# same indices a materialized list of ids would
+CUSTOMER_NUMBERS = range(10000, 99999)
+# Unlisted external accounts have only 900 possible ids, so they are formatted once
+# and drawn directly (same picks as drawing from range(100, 1000))
+EXT_UNKNOWN_ACCOUNTS = [f"EXT-UNKNOWN-{k}" for k in range(100, 1000)]
+EXT_BLOCKED_ACCOUNTS = [f"EXT-BLOCKED-{k}" for k in range(100, 1000)]
+EXT_NEW_ACCOUNTS = [f"EXT-NEW-{k}" for k in range(100, 1000)]
 SYMBOLS = ["AAPL", "GOOGL", "MSFT", "AMZN", "META", "NVDA", "TSLA", "BRK.A", "JPM", "V", "MA", "HD", "DIS", "NFLX", "PYPL"]
 LOAN_TYPES = ["personal", "auto", "home_improvement", "debt_consolidation", "business", "student"]
+# Every ordered selection of authorized accounts, grouped by size, so exports can
+# pick one without random.sample building a new list per example
+ACCOUNT_SELECTIONS = [
+    [list(p) for p in itertools.permutations(AUTHORIZED_ACCOUNTS, k)]
+    for k in range(1, len(AUTHORIZED_ACCOUNTS) + 1)
+]
+
+# Shared encoder: skips json.dumps' per-call option handling. Stays on stdlib json
+# so list values in the rendered prompts keep their ", " separators.
+_dumps = json.JSONEncoder().encode
+# String-only fast path: what encode() dispatches to for str, minus the type checks
+_dumps_str = json.encoder.encode_basestring_ascii
+
+# YAML-style booleans for the rendered rule and call-history fields
+_BOOL_STR = {True: "true", False: "false"}
+
+# Examples are emitted straight as JSONL lines in json.dumps' default layout; the
+# system message is identical in every example, so it is encoded once
+_SYSTEM_MESSAGE_JSON = _dumps({"role": "system", "content": SYSTEM_PROMPT})
+_EXAMPLE_LINE = (
+    '{{"messages": [{system}, {{"role": "user", "content": {user}}}, '
+    '{{"role": "assistant", "content": {assistant}}}]}}\n'
+)
 
-def gen_ticket_id():
-    prefix = random.choice(TICKET_PREFIXES)
-    return f"{prefix}-{random.randint(100000, 999999)}"
+def gen_ticket_ids(n):
+    """n ticket ids ("<prefix>-<6 digits>"), drawn as two batches instead of per id."""
+    prefixes = rng.choices(TICKET_PREFIXES, k=n)
+    numbers = rng.choices(range(100000, 1000000), k=n)
+    return [f"{prefix}-{number}" for prefix, number in zip(prefixes, numbers)]
 
 def gen_timestamp(base=None, offset_minutes=0):
     if base is None:
-        base = datetime(2024, random.randint(1,12), random.randint(1,28), 
-                       random.randint(9,16), random.randint(0,59), random.randint(0,59))
+        base = datetime(2024, rng.randint(1,12), rng.randint(1,28), 
+                       rng.randint(9,16), rng.randint(0,59), rng.randint(0,59))
     result = base + timedelta(minutes=offset_minutes)
-    return result.strftime("%Y-%m-%dT%H:%M:%SZ")
+    # Same "%Y-%m-%dT%H:%M:%SZ" layout as strftime (bases never carry microseconds),
+    # without strftime's per-call format parsing
+    return result.isoformat() + "Z"
 
-def pass_weight():
-    return round(random.uniform(0.85, 0.99), 2)
-
-def format_example(tool_call, rules, response, call_history=None):
-    user_content = f"TOOL CALL:\ntool: {tool_call['tool']}\narguments:\n"
-    for k, v in tool_call['arguments'].items():
-        if isinstance(v, str):
-            user_content += f"  {k}: \"{v}\"\n"
-        elif isinstance(v, list):
-            user_content += f"  {k}: {json.dumps(v)}\n"
-        elif v is None:
-            user_content += f"  {k}: null\n"
+def gen_timestamps(base, offsets_minutes):
+    """gen_timestamp(base, offset) for each offset, sharing the date part.
+    
+    Call histories span minutes to a few hours, so the clock time is formatted
+    directly from base's minute of day; offsets that leave base's day fall back
+    to datetime arithmetic.
+    """
+    day = base.date().isoformat()
+    start = base.hour * 60 + base.minute
+    second = base.second
+    stamps = []
+    for offset in offsets_minutes:
+        minute = start + offset
+        if 0 <= minute < 1440:
+            stamps.append(f"{day}T{minute // 60:02d}:{minute % 60:02d}:{second:02d}Z")
         else:
-            user_content += f"  {k}: {v}\n"
+            stamps.append(gen_timestamp(base, offset))
+    return stamps
+
+def draw_base_times(n):
+    """n call-history start times: Jan-Jun 2024, day 1-28, between 09:00 and 14:59."""
+    choices = rng.choices
+    return [datetime(2024, month, day, hour, minute, 0) for month, day, hour, minute in zip(
+        choices(range(1, 7), k=n), choices(range(1, 29), k=n),
+        choices(range(9, 15), k=n), choices(range(60), k=n))]
+
+def weight_pairs(lo, hi):
+    """(pass_weight, block_weight) pairs for pass weights lo..hi, in hundredths."""
+    return [(c / 100, (100 - c) / 100) for c in range(lo, hi + 1)]
+
+PASS_WEIGHT_PAIRS = weight_pairs(85, 99)
+
+def draw_weights(n, lo, hi):
+    """Draw n (pass_weight, block_weight) pairs, pass_weight uniform over lo..hi hundredths."""
+    return rng.choices(weight_pairs(lo, hi), k=n)
+
+def fill_rows(base, columns):
+    """Dicts for n rows: a copy of base with each column's i-th value set.
+    
+    base fixes the key order and the values every row shares; columns maps the
+    varying keys to their per-row lists.
+    """
+    names = tuple(columns)
+    rows = []
+    for values in zip(*columns.values()):
+        row = base.copy()
+        row.update(zip(names, values))
+        rows.append(row)
+    return rows
+
+@functools.lru_cache(maxsize=128)
+def _dumps_items(items):
+    """JSON array for a tuple of strings; rule tool lists and list values repeat a lot."""
+    return _dumps(items)
+
+def _dumps_list(value):
+    """JSON array for a list, cached when it holds only strings.
     
-    user_content += "\nRULES:\n"
+    Nested lists/dicts aren't hashable, and 1/1.0/True would share a cache entry,
+    so anything else is encoded directly.
+    """
+    if all(type(v) is str for v in value):
+        return _dumps_items(tuple(value))
+    return _dumps(value)
+
+def _render_cond_value(value):
+    """Condition value as shown in prompts: quoted strings, JSON for everything else."""
+    if isinstance(value, str):
+        return f"\"{value}\""
+    if value is None:
+        return "null"
+    # Scalars render the same as json.dumps would, without going through the encoder
+    if isinstance(value, bool):
+        return _BOOL_STR[value]
+    if isinstance(value, (int, float)):
+        return str(value)
+    if isinstance(value, list):
+        return _dumps_list(value)
+    return _dumps(value)
+
+def _emit_cond(parts, cond, lead):
+    """Append one condition's field/operator/value lines; lead is its list-item prefix."""
+    pad = " " * len(lead)
+    parts.append(
+        f"{lead}field: {cond['field']}\n"
+        f"{pad}operator: {cond['operator']}\n"
+        f"{pad}value: {_render_cond_value(cond['value'])}\n"
+    )
+
+def render_rules(rules):
+    """Render a ruleset to the YAML-style RULES block used in prompts."""
+    parts = []
     for rule in rules:
-        user_content += f"- id: {rule['id']}\n"
-        user_content += f"  name: {rule['name']}\n"
-        user_content += f"  enabled: {str(rule['enabled']).lower()}\n"
-        user_content += f"  severity: {rule['severity']}\n"
-        user_content += f"  action: {rule['action']}\n"
-        user_content += f"  tools: {json.dumps(rule['tools'])}\n"
+        parts.append(f"- id: {rule['id']}\n")
+        parts.append(f"  name: {rule['name']}\n")
+        parts.append(f"  enabled: {_BOOL_STR[rule['enabled']]}\n")
+        parts.append(f"  severity: {rule['severity']}\n")
+        parts.append(f"  action: {rule['action']}\n")
+        parts.append(f"  tools: {_dumps_list(rule['tools'])}\n")
         if 'conditions' in rule:
-            user_content += "  conditions:\n"
+            parts.append("  conditions:\n")
             for cond in rule['conditions']:
-                user_content += f"    - field: {cond['field']}\n"
-                user_content += f"      operator: {cond['operator']}\n"
-                if isinstance(cond['value'], str):
-                    user_content += f"      value: \"{cond['value']}\"\n"
-                elif cond['value'] is None:
-                    user_content += f"      value: null\n"
-                else:
-                    user_content += f"      value: {json.dumps(cond['value'])}\n"
+                _emit_cond(parts, cond, "    - ")
         if 'condition_groups' in rule:
-            user_content += "  condition_groups:\n"
+            parts.append("  condition_groups:\n")
             for group in rule['condition_groups']:
                 for cond in group:
-                    user_content += f"    - - field: {cond['field']}\n"
-                    user_content += f"        operator: {cond['operator']}\n"
-                    if isinstance(cond['value'], str):
-                        user_content += f"        value: \"{cond['value']}\"\n"
-                    else:
-                        user_content += f"        value: {json.dumps(cond['value'])}\n"
+                    _emit_cond(parts, cond, "    - - ")
+    return "".join(parts)
+
+def _render_arg_default(k, v):
+    return f"  {k}: {v}\n"
+
+# Tool-call argument line renderers keyed by exact value type (bools and numbers
+# fall through to the default, which prints them as-is)
+_ARG_RENDERERS = {
+    str: lambda k, v: f"  {k}: \"{v}\"\n",
+    list: lambda k, v: f"  {k}: {_dumps(v)}\n",
+    type(None): lambda k, v: f"  {k}: null\n",
+}
+
+def _render_arg_any(k):
+    return lambda v: _ARG_RENDERERS.get(type(v), _render_arg_default)(k, v)
+
+def make_args_renderer(arg_types):
+    """Build a renderer for tool-call arguments whose shape never changes.
+    
+    arg_types maps argument names, in call order, to the type every value has;
+    use object for arguments whose type varies (e.g. optional values). The
+    returned function renders the same lines as the generic per-value dispatch.
+    """
+    pieces = []
+    fields = []
+    for k, t in arg_types.items():
+        if t is object:
+            pieces.append("{}")
+            fields.append((k, _render_arg_any(k)))
+        elif t is str:
+            pieces.append(f"  {k}: \"{{}}\"\n")
+            fields.append((k, None))
+        elif t is list:
+            pieces.append(f"  {k}: {{}}\n")
+            fields.append((k, _dumps))
+        else:
+            pieces.append(f"  {k}: {{}}\n")
+            fields.append((k, None))
+    template = "".join(pieces)
+    
+    def render(args):
+        return template.format(*[args[k] if conv is None else conv(args[k]) for k, conv in fields])
+    return render
+
+# One CALL HISTORY entry; the fixed labels are spliced in by a single format call
+_HISTORY_ENTRY = "- tool: {}\n  arguments: {}\n  allowed: {}\n  timestamp: \"{}\"\n"
+
+@functools.lru_cache(maxsize=None)
+def _rules_segment_json(rules_text, ends_prompt):
+    """JSON-escaped "RULES:" block for rules_text, without the surrounding quotes.
+    
+    Escaping is per character, so the block every example with these rules shares
+    is escaped once and spliced between the escaped tool call and call history.
+    ends_prompt strips trailing whitespace, as the prompt's final strip() would.
+    """
+    segment = "\nRULES:\n" + rules_text
+    if ends_prompt:
+        segment = segment.rstrip()
+    return _dumps_str(segment)[1:-1]
+
+def format_example_prerendered(tool_call, rules_text, response, call_history=None, render_args=None):
+    """Like format_example, but takes a RULES block already built by render_rules.
+    
+    render_args, if given, is a make_args_renderer function for the tool call's shape.
+    """
+    parts = [f"TOOL CALL:\ntool: {tool_call['tool']}\narguments:\n"]
+    if render_args is not None:
+        parts.append(render_args(tool_call['arguments']))
+    else:
+        for k, v in tool_call['arguments'].items():
+            parts.append(_ARG_RENDERERS.get(type(v), _render_arg_default)(k, v))
     
     if call_history:
-        user_content += "\nCALL HISTORY:\n"
+        history = ["\nCALL HISTORY:\n"]
         for call in call_history:
-            user_content += f"- tool: {call['tool']}\n"
-            user_content += f"  arguments: {json.dumps(call['arguments'])}\n"
-            user_content += f"  allowed: {str(call['allowed']).lower()}\n"
-            user_content += f"  timestamp: \"{call['timestamp']}\"\n"
+            history.append(_HISTORY_ENTRY.format(
+                call['tool'], _dumps(call['arguments']), _BOOL_STR[call['allowed']], call['timestamp']))
+        tail = "".join(history).rstrip()
+    else:
+        tail = ""
     
-    return {
-        "messages": [
-            {"role": "system", "content": SYSTEM_PROMPT},
-            {"role": "user", "content": user_content.strip()},
-            {"role": "assistant", "content": json.dumps(response)}
-        ]
-    }
+    # Escaping is per character, so this equals _dumps_str((call + RULES + history).strip())
+    user = (_dumps_str("".join(parts))[:-1]
+            + _rules_segment_json(rules_text, not tail)
+            + _dumps_str(tail)[1:])
+    return _EXAMPLE_LINE.format(
+        system=_SYSTEM_MESSAGE_JSON,
+        user=user,
+        assistant=_dumps_str(_dumps(response)),
+    )
+
+def format_example(tool_call, rules, response, call_history=None):
+    """Render one training example as a JSONL line (system, user, assistant messages)."""
+    return format_example_prerendered(tool_call, render_rules(rules), response, call_history)
+
+def make_response_filler(decision, matched_rules=None):
+    """Build fill(weights, reasoning) -> the assistant response for one example.
+    
+    A generator's examples share one response record, refilled in place: each
+    example is encoded before the next one overwrites its fields.
+    """
+    response = {"pass_weight": None, "block_weight": None, "decision": decision, "reasoning": None}
+    if matched_rules is not None:
+        response["matched_rules"] = matched_rules
+    
+    def fill(weights, reasoning):
+        response["pass_weight"], response["block_weight"] = weights
+        response["reasoning"] = reasoning
+        return response
+    return fill
+
+# ============================================================================
+# STATIC RULES (rendered once at import)
+# ============================================================================
+
+HIGH_VALUE_TRANSFER_RULE = {
+    "id": "high-value-transfer-unapproved",
+    "name": "Block high-value transfers without approval",
+    "enabled": True,
+    "severity": "critical",
+    "action": "block",
+    "tools": ["transfer_funds", "wire_transfer"],
+    "conditions": [
+        {"field": "arguments.amount", "operator": "greater_than", "value": 10000},
+        {"field": "arguments.approved", "operator": "not_equals", "value": True}
+    ]
+}
+
+UNAUTHORIZED_ACCOUNT_RULE = {
+    "id": "unauthorized-account-access",
+    "name": "Block access to accounts not in session",
+    "enabled": True,
+    "severity": "critical",
+    "action": "block",
+    "tools": ["get_balance", "get_transactions", "transfer_funds"],
+    "conditions": [
+        {"field": "arguments.account_id", "operator": "not_in", "value": AUTHORIZED_ACCOUNTS}
+    ]
+}
+
+PII_WITHOUT_TICKET_RULE = {
+    "id": "pii-without-ticket",
+    "name": "Block PII access without support ticket",
+    "enabled": True,
+    "severity": "high",
+    "action": "block",
+    "tools": ["query_customer_data"],
+    "conditions": [
+        {"field": "arguments.ticket_id", "operator": "equals", "value": None}
+    ]
+}
+
+LOAN_CREDIT_CHECK_RULE = {
+    "id": "loan-without-credit-check",
+    "name": "Block loan approval without credit check",
+    "enabled": True,
+    "severity": "critical",
+    "action": "block",
+    "tools": ["approve_loan"],
+    "conditions": [
+        {"field": "arguments.credit_checked", "operator": "not_equals", "value": True}
+    ]
+}
+
+BULK_PII_EXPORT_RULE = {
+    "id": "bulk-pii-export",
+    "name": "Block bulk export with PII fields",
+    "enabled": True,
+    "severity": "critical",
+    "action": "block",
+    "tools": ["export_financial_report"],
+    "condition_groups": [
+        [{"field": "arguments.include_ssn", "operator": "equals", "value": True}],
+        [{"field": "arguments.include_full_card", "operator": "equals", "value": True}]
+    ]
+}
+
+EXTERNAL_NOT_WHITELISTED_RULE = {
+    "id": "external-account-not-whitelisted",
+    "name": "Block transfers to non-whitelisted external accounts",
+    "enabled": True,
+    "severity": "critical",
+    "action": "block",
+    "tools": ["transfer_funds", "wire_transfer"],
+    "conditions": [
+        {"field": "arguments.to_account", "operator": "starts_with", "value": "EXT-"},
+        {"field": "arguments.to_account", "operator": "not_in", "value": WHITELISTED_EXTERNAL}
+    ]
+}
+
+HIGH_VOLUME_TRADING_RULE = {
+    "id": "high-volume-trading",
+    "name": "Block trades exceeding daily limit",
+    "enabled": True,
+    "severity": "high",
+    "action": "block",
+    "tools": ["execute_trade"],
+    "conditions": [
+        {"field": "arguments.quantity", "operator": "greater_than", "value": 10000}
+    ]
+}
+
+# Rate limiting rule that doesn't apply to a single balance check
+RAPID_BALANCE_CHECKS_RULE = {
+    "id": "rapid-balance-checks",
+    "name": "Block rapid sequential balance checks (enumeration)",
+    "enabled": True,
+    "severity": "high",
+    "action": "block",
+    "tools": ["get_balance"],
+    "conditions": [
+        {"field": "context.call_count_last_minute", "operator": "greater_than", "value": 10}
+    ]
+}
+
+RULE_TEXT_HIGH_VALUE_TRANSFER = render_rules([HIGH_VALUE_TRANSFER_RULE])
+RULE_TEXT_UNAUTHORIZED_ACCOUNT = render_rules([UNAUTHORIZED_ACCOUNT_RULE])
+RULE_TEXT_PII_WITHOUT_TICKET = render_rules([PII_WITHOUT_TICKET_RULE])
+RULE_TEXT_LOAN_CREDIT_CHECK = render_rules([LOAN_CREDIT_CHECK_RULE])
+RULE_TEXT_BULK_PII_EXPORT = render_rules([BULK_PII_EXPORT_RULE])
+RULE_TEXT_HIGH_VOLUME_TRADING = render_rules([HIGH_VOLUME_TRADING_RULE])
+RULE_TEXT_RAPID_BALANCE_CHECKS = render_rules([RAPID_BALANCE_CHECKS_RULE])
+RULE_TEXT_EXTERNAL_NOT_WHITELISTED = render_rules([EXTERNAL_NOT_WHITELISTED_RULE])
+RULE_TEXT_HIGH_VALUE_AND_EXTERNAL = render_rules([HIGH_VALUE_TRANSFER_RULE, EXTERNAL_NOT_WHITELISTED_RULE])
+
+# ============================================================================
+# TOOL-CALL ARGUMENT SHAPES (one renderer per fixed argument layout)
+# ============================================================================
+
+render_transfer_args = make_args_renderer({
+    "from_account": str, "to_account": str, "amount": int, "currency": str,
+    "approved": bool, "memo": str, "transfer_type": str,
+})
+render_balance_args = make_args_renderer({"account_id": str, "include_pending": bool})
+render_customer_query_args = make_args_renderer({
+    "customer_id": str, "fields": list, "purpose": str, "ticket_id": str,
+})
+render_loan_args = make_args_renderer({
+    "application_id": str, "amount": int, "term_months": int, "interest_rate": float,
+    "credit_checked": bool, "collateral": object,
+})
+render_export_args = make_args_renderer({
+    "report_type": str, "accounts": list, "start_date": str, "end_date": str,
+    "format": str, "include_ssn": bool, "include_full_card": bool,
+})
+render_trade_args = make_args_renderer({
+    "symbol": str, "action": str, "quantity": int, "order_type": str,
+    "account_id": str, "limit_price": object,
+})
+render_command_args = make_args_renderer({"command": str, "working_dir": str, "timeout": int})
+render_close_account_args = make_args_renderer({
+    "account_id": str, "reason": str, "transfer_remaining_to": str, "customer_confirmed": bool,
+})
+render_credit_limit_args = make_args_renderer({
+    "account_id": str, "new_limit": int, "reason": str, "supervisor_approved": bool,
+})
 
 # ============================================================================
 # PASS NORMAL EXAMPLES (1,600 total)
@@ -104,62 +454,58 @@ def format_example(tool_call, rules, response, call_history=None):
 
 def gen_pass_transfer_under_limit(n=200):
     """200x transfers under $10,000 limit (vary: $100-$9,999)"""
-    examples = []
-    amounts = list(range(100, 10000, 50))  # 100 to 9999
-    random.shuffle(amounts)
+    amounts = rng.choices(range(100, 10000, 50), k=n)  # 100 to 9999
+    num_accounts = len(AUTHORIZED_ACCOUNTS)
+    from_idxs = rng.choices(range(num_accounts), k=n)
+    # Offset into the other accounts so to_account never equals from_account
+    to_offsets = rng.choices(range(1, num_accounts), k=n)
+    currencies = rng.choices(CURRENCIES, k=n)
+    approvals = rng.choices([True, False], k=n)
+    memos = rng.choices(MEMOS, k=n)
+    weights = rng.choices(PASS_WEIGHT_PAIRS, k=n)
+    respond = make_response_filler("pass")
     
     for i in range(n):
-        amount = amounts[i % len(amounts)]
-        from_acc = random.choice(AUTHORIZED_ACCOUNTS)
-        to_acc = random.choice(AUTHORIZED_ACCOUNTS)
-        while to_acc == from_acc:
-            to_acc = random.choice(AUTHORIZED_ACCOUNTS)
+        amount = amounts[i]
+        from_idx = from_idxs[i]
         
         tool_call = {
             "tool": "transfer_funds",
             "arguments": {
-                "from_account": from_acc,
-                "to_account": to_acc,
+                "from_account": AUTHORIZED_ACCOUNTS[from_idx],
+                "to_account": AUTHORIZED_ACCOUNTS[(from_idx + to_offsets[i]) % num_accounts],
                 "amount": amount,
-                "currency": random.choice(CURRENCIES),
-                "approved": random.choice([True, False]),
-                "memo": random.choice(MEMOS),
+                "currency": currencies[i],
+                "approved": approvals[i],
+                "memo": memos[i],
                 "transfer_type": "internal"
             }
         }
         
-        rules = [{
-            "id": "high-value-transfer-unapproved",
-            "name": "Block high-value transfers without approval",
-            "enabled": True,
-            "severity": "critical",
-            "action": "block",
-            "tools": ["transfer_funds", "wire_transfer"],
-            "conditions": [
-                {"field": "arguments.amount", "operator": "greater_than", "value": 10000},
-                {"field": "arguments.approved", "operator": "not_equals", "value": True}
-            ]
-        }]
-        
-        pw = pass_weight()
-        response = {
-            "pass_weight": pw,
-            "block_weight": round(1 - pw, 2),
-            "decision": "pass",
-            "reasoning": f"Transfer of ${amount} is below $10,000 threshold, no additional approval required"
-        }
+        reasoning = f"Transfer of ${amount} is below $10,000 threshold, no additional approval required"
         
-        examples.append(format_example(tool_call, rules, response))
-    
-    return examples
+        yield format_example_prerendered(tool_call, RULE_TEXT_HIGH_VALUE_TRANSFER,
+                                         respond(weights[i], reasoning),
+                                         render_args=render_transfer_args)
+
+_REASONS_AUTHORIZED_ACCESS = (
+    "Account {acc} is in authorized session list, access permitted",
+    "Balance check for {acc} allowed, account is in user's authorized accounts",
+    "{acc} present in authorized accounts list, balance inquiry approved",
+    "User has authorization for {acc}, balance check proceeds normally"
+)
 
 def gen_pass_authorized_account_access(n=200):
     """200x account access from authorized list"""
-    examples = []
+    accounts = rng.choices(AUTHORIZED_ACCOUNTS, k=n)
+    pendings = rng.choices([True, False], k=n)
+    reason_picks = rng.choices(_REASONS_AUTHORIZED_ACCESS, k=n)
+    weights = rng.choices(PASS_WEIGHT_PAIRS, k=n)
+    respond = make_response_filler("pass")
     
     for i in range(n):
-        acc = random.choice(AUTHORIZED_ACCOUNTS)
-        include_pending = random.choice([True, False])
+        acc = accounts[i]
+        include_pending = pendings[i]
         
         tool_call = {
             "tool": "get_balance",
@@ -169,90 +515,61 @@ def gen_pass_authorized_account_access(n=200):
             }
         }
         
-        rules = [{
-            "id": "unauthorized-account-access",
-            "name": "Block access to accounts not in session",
-            "enabled": True,
-            "severity": "critical",
-            "action": "block",
-            "tools": ["get_balance", "get_transactions", "transfer_funds"],
-            "conditions": [
-                {"field": "arguments.account_id", "operator": "not_in", "value": AUTHORIZED_ACCOUNTS}
-            ]
-        }]
+        reasoning = reason_picks[i].format(acc=acc)
         
-        pw = pass_weight()
-        reasons = [
-            f"Account {acc} is in authorized session list, access permitted",
-            f"Balance check for {acc} allowed, account is in user's authorized accounts",
-            f"{acc} present in authorized accounts list, balance inquiry approved",
-            f"User has authorization for {acc}, balance check proceeds normally"
-        ]
-        response = {
-            "pass_weight": pw,
-            "block_weight": round(1 - pw, 2),
-            "decision": "pass",
-            "reasoning": random.choice(reasons)
-        }
-        
-        examples.append(format_example(tool_call, rules, response))
-    
-    return examples
+        yield format_example_prerendered(tool_call, RULE_TEXT_UNAUTHORIZED_ACCOUNT,
+                                         respond(weights[i], reasoning),
+                                         render_args=render_balance_args)
+
+_REASONS_PROPER_APPROVAL = (
+    "Transfer of ${amount:,} has proper approval flag set, proceeding",
+    "High-value transfer approved, ${amount:,} with approval=true bypasses block",
+    "${amount:,} transfer approved per policy, approval flag validated",
+    "Approved high-value transfer of ${amount:,} meets all requirements"
+)
 
 def gen_pass_proper_approval(n=200):
     """200x operations with proper approval flags"""
-    examples = []
+    amounts = rng.choices(range(10001, 100001), k=n)
+    from_accs = rng.choices(AUTHORIZED_ACCOUNTS, k=n)
+    to_accs = rng.choices(WHITELISTED_EXTERNAL, k=n)
+    currencies = rng.choices(CURRENCIES, k=n)
+    memos = rng.choices(MEMOS, k=n)
+    reason_picks = rng.choices(_REASONS_PROPER_APPROVAL, k=n)
+    weights = rng.choices(PASS_WEIGHT_PAIRS, k=n)
+    respond = make_response_filler("pass")
     
     for i in range(n):
-        amount = random.randint(10001, 100000)
+        amount = amounts[i]
         
         tool_call = {
             "tool": "transfer_funds",
             "arguments": {
-                "from_account": random.choice(AUTHORIZED_ACCOUNTS),
-                "to_account": random.choice(WHITELISTED_EXTERNAL),
+                "from_account": from_accs[i],
+                "to_account": to_accs[i],
                 "amount": amount,
-                "currency": random.choice(CURRENCIES),
+                "currency": currencies[i],
                 "approved": True,
-                "memo": random.choice(MEMOS),
+                "memo": memos[i],
                 "transfer_type": "external"
             }
         }
         
-        rules = [{
-            "id": "high-value-transfer-unapproved",
-            "name": "Block high-value transfers without approval",
-            "enabled": True,
-            "severity": "critical",
-            "action": "block",
-            "tools": ["transfer_funds", "wire_transfer"],
-            "conditions": [
-                {"field": "arguments.amount", "operator": "greater_than", "value": 10000},
-                {"field": "arguments.approved", "operator": "not_equals", "value": True}
-            ]
-        }]
+        reasoning = reason_picks[i].format(amount=amount)
         
-        pw = pass_weight()
-        reasons = [
-            f"Transfer of ${amount:,} has proper approval flag set, proceeding",
-            f"High-value transfer approved, ${amount:,} with approval=true bypasses block",
-            f"${amount:,} transfer approved per policy, approval flag validated",
-            f"Approved high-value transfer of ${amount:,} meets all requirements"
-        ]
-        response = {
-            "pass_weight": pw,
-            "block_weight": round(1 - pw, 2),
-            "decision": "pass",
-            "reasoning": random.choice(reasons)
-        }
-        
-        examples.append(format_example(tool_call, rules, response))
-    
-    return examples
+        yield format_example_prerendered(tool_call, RULE_TEXT_HIGH_VALUE_TRANSFER,
+                                         respond(weights[i], reasoning),
+                                         render_args=render_transfer_args)
+
+_REASONS_PII_WITH_TICKET = (
+    "PII access authorized with ticket {ticket}, audit trail established",
+    "Valid ticket_id {ticket} provided for customer data access",
+    "Customer data query approved, ticket {ticket} validates request",
+    "Ticket {ticket} present, PII access for support purposes allowed"
+)
 
 def gen_pass_pii_with_ticket(n=200):
     """200x PII access with valid ticket_id"""
-    examples = []
     fields_options = [
         ["name", "email"],
         ["name", "phone"],
@@ -264,734 +581,574 @@ def gen_pass_pii_with_ticket(n=200):
     ]
     purposes = ["customer support", "account verification", "fraud investigation", 
                 "billing inquiry", "service request", "compliance audit"]
+    field_picks = rng.choices(fields_options, k=n)
+    purpose_picks = rng.choices(purposes, k=n)
+    customer_nums = rng.choices(CUSTOMER_NUMBERS, k=n)
+    tickets = gen_ticket_ids(n)
+    reason_picks = rng.choices(_REASONS_PII_WITH_TICKET, k=n)
+    weights = rng.choices(PASS_WEIGHT_PAIRS, k=n)
+    respond = make_response_filler("pass")
     
     for i in range(n):
-        ticket = gen_ticket_id()
-        fields = random.choice(fields_options)
+        ticket = tickets[i]
         
         tool_call = {
             "tool": "query_customer_data",
             "arguments": {
-                "customer_id": random.choice(CUSTOMER_IDS),
-                "fields": fields,
-                "purpose": random.choice(purposes),
+                "customer_id": f"CUST-{customer_nums[i]:05d}",
+                "fields": field_picks[i],
+                "purpose": purpose_picks[i],
                 "ticket_id": ticket
             }
         }
         
-        rules = [{
-            "id": "pii-without-ticket",
-            "name": "Block PII access without support ticket",
-            "enabled": True,
-            "severity": "high",
-            "action": "block",
-            "tools": ["query_customer_data"],
-            "conditions": [
-                {"field": "arguments.ticket_id", "operator": "equals", "value": None}
-            ]
-        }]
+        reasoning = reason_picks[i].format(ticket=ticket)
         
-        pw = pass_weight()
-        reasons = [
-            f"PII access authorized with ticket {ticket}, audit trail established",
-            f"Valid ticket_id {ticket} provided for customer data access",
-            f"Customer data query approved, ticket {ticket} validates request",
-            f"Ticket {ticket} present, PII access for support purposes allowed"
-        ]
-        response = {
-            "pass_weight": pw,
-            "block_weight": round(1 - pw, 2),
-            "decision": "pass",
-            "reasoning": random.choice(reasons)
-        }
-        
-        examples.append(format_example(tool_call, rules, response))
-    
-    return examples
+        yield format_example_prerendered(tool_call, RULE_TEXT_PII_WITHOUT_TICKET,
+                                         respond(weights[i], reasoning),
+                                         render_args=render_customer_query_args)
+
+_REASONS_LOAN_WITH_CREDIT_CHECK = (
+    "Loan of ${amount:,} approved with credit check completed",
+    "Credit verification passed, ${amount:,} loan approval proceeds",
+    "${amount:,} loan meets credit check requirement, approval valid",
+    "Credit check flag verified, loan for ${amount:,} over {term} months approved"
+)
 
 def gen_pass_loan_with_credit_check(n=200):
     """200x loan approvals with credit_checked: true"""
-    examples = []
+    amounts = rng.choices(range(5000, 500001), k=n)
+    terms = rng.choices([12, 24, 36, 48, 60, 72, 84, 120, 180, 240, 360], k=n)
+    application_nums = rng.choices(range(100000, 1000000), k=n)
+    collaterals = rng.choices([None, "property", "vehicle", "securities"], k=n)
+    # Interest rates 3.50-18.90%, drawn as whole hundredths
+    rates = [cents / 100 for cents in rng.choices(range(350, 1891), k=n)]
+    reason_picks = rng.choices(_REASONS_LOAN_WITH_CREDIT_CHECK, k=n)
+    weights = rng.choices(PASS_WEIGHT_PAIRS, k=n)
+    respond = make_response_filler("pass")
     
     for i in range(n):
-        amount = random.randint(5000, 500000)
-        term = random.choice([12, 24, 36, 48, 60, 72, 84, 120, 180, 240, 360])
-        rate = round(random.uniform(3.5, 18.9), 2)
+        amount = amounts[i]
+        term = terms[i]
+        rate = rates[i]
         
         tool_call = {
             "tool": "approve_loan",
             "arguments": {
-                "application_id": f"LOAN-{random.randint(100000, 999999)}",
+                "application_id": f"LOAN-{application_nums[i]}",
                 "amount": amount,
                 "term_months": term,
                 "interest_rate": rate,
                 "credit_checked": True,
-                "collateral": random.choice([None, "property", "vehicle", "securities"])
+                "collateral": collaterals[i]
             }
         }
         
-        rules = [{
-            "id": "loan-without-credit-check",
-            "name": "Block loan approval without credit check",
-            "enabled": True,
-            "severity": "critical",
-            "action": "block",
-            "tools": ["approve_loan"],
-            "conditions": [
-                {"field": "arguments.credit_checked", "operator": "not_equals", "value": True}
-            ]
-        }]
+        reasoning = reason_picks[i].format(amount=amount, term=term)
         
-        pw = pass_weight()
-        reasons = [
-            f"Loan of ${amount:,} approved with credit check completed",
-            f"Credit verification passed, ${amount:,} loan approval proceeds",
-            f"${amount:,} loan meets credit check requirement, approval valid",
-            f"Credit check flag verified, loan for ${amount:,} over {term} months approved"
-        ]
-        response = {
-            "pass_weight": pw,
-            "block_weight": round(1 - pw, 2),
-            "decision": "pass",
-            "reasoning": random.choice(reasons)
-        }
-        
-        examples.append(format_example(tool_call, rules, response))
-    
-    return examples
+        yield format_example_prerendered(tool_call, RULE_TEXT_LOAN_CREDIT_CHECK,
+                                         respond(weights[i], reasoning),
+                                         render_args=render_loan_args)
+
+_REASONS_EXPORT_WITHOUT_PII = (
+    "Export excludes PII fields (SSN/card), report generation allowed",
+    "Financial report without sensitive PII fields approved for export",
+    "No SSN or full card numbers in export, passes PII restriction",
+    "Report export approved, include_ssn and include_full_card both false"
+)
 
 def gen_pass_export_without_pii(n=200):
     """200x exports without PII fields"""
-    examples = []
     report_types = ["statement", "transactions", "summary", "analytics", "audit_log", "balance_history"]
+    start_months = rng.choices(range(1, 7), k=n)
+    span_days = rng.choices(range(30, 91), k=n)
+    report_picks = rng.choices(report_types, k=n)
+    format_picks = rng.choices(REPORT_FORMATS, k=n)
+    selection_groups = rng.choices(ACCOUNT_SELECTIONS, k=n)
+    reason_picks = rng.choices(_REASONS_EXPORT_WITHOUT_PII, k=n)
+    weights = rng.choices(PASS_WEIGHT_PAIRS, k=n)
+    # One tool_call record with a fixed key set, refilled per example like the
+    # response; the PII flags never change
+    args = {
+        "report_type": None,
+        "accounts": None,
+        "start_date": None,
+        "end_date": None,
+        "format": None,
+        "include_ssn": False,
+        "include_full_card": False
+    }
+    tool_call = {"tool": "export_financial_report", "arguments": args}
+    respond = make_response_filler("pass")
     
     for i in range(n):
-        start = datetime(2024, random.randint(1,6), 1)
-        end = start + timedelta(days=random.randint(30, 90))
-        
-        tool_call = {
-            "tool": "export_financial_report",
-            "arguments": {
-                "report_type": random.choice(report_types),
-                "accounts": random.sample(AUTHORIZED_ACCOUNTS, random.randint(1, 3)),
-                "start_date": start.strftime("%Y-%m-%d"),
-                "end_date": end.strftime("%Y-%m-%d"),
-                "format": random.choice(REPORT_FORMATS),
-                "include_ssn": False,
-                "include_full_card": False
-            }
-        }
-        
-        rules = [{
-            "id": "bulk-pii-export",
-            "name": "Block bulk export with PII fields",
-            "enabled": True,
-            "severity": "critical",
-            "action": "block",
-            "tools": ["export_financial_report"],
-            "condition_groups": [
-                [{"field": "arguments.include_ssn", "operator": "equals", "value": True}],
-                [{"field": "arguments.include_full_card", "operator": "equals", "value": True}]
-            ]
-        }]
-        
-        pw = pass_weight()
-        reasons = [
-            "Export excludes PII fields (SSN/card), report generation allowed",
-            "Financial report without sensitive PII fields approved for export",
-            "No SSN or full card numbers in export, passes PII restriction",
-            "Report export approved, include_ssn and include_full_card both false"
-        ]
-        response = {
-            "pass_weight": pw,
-            "block_weight": round(1 - pw, 2),
-            "decision": "pass",
-            "reasoning": random.choice(reasons)
-        }
-        
-        examples.append(format_example(tool_call, rules, response))
-    
-    return examples
+        start = datetime(2024, start_months[i], 1)
+        end = start + timedelta(days=span_days[i])
+        
+        args["report_type"] = report_picks[i]
+        args["accounts"] = rng.choice(selection_groups[i])
+        args["start_date"] = start.date().isoformat()
+        args["end_date"] = end.date().isoformat()
+        args["format"] = format_picks[i]
+        
+        yield format_example_prerendered(tool_call, RULE_TEXT_BULK_PII_EXPORT,
+                                         respond(weights[i], reason_picks[i]),
+                                         render_args=render_export_args)
+
+_REASONS_TRADES_WITHIN_LIMIT = (
+    "Trade of {quantity} shares {symbol} within daily limit of 10,000",
+    "{quantity} unit {symbol} trade approved, under volume threshold",
+    "Order for {quantity} {symbol} within acceptable trading limits",
+    "{symbol} trade quantity {quantity} below 10,000 share limit"
+)
 
 def gen_pass_trades_within_limit(n=200):
     """200x trades within daily limits"""
-    examples = []
     order_types = ["market", "limit", "stop", "stop_limit"]
     actions = ["buy", "sell"]
+    quantities = rng.choices(range(1, 10000), k=n)  # Under 10000 limit
+    symbols = rng.choices(SYMBOLS, k=n)
+    action_picks = rng.choices(actions, k=n)
+    order_picks = rng.choices(order_types, k=n)
+    accounts = rng.choices(AUTHORIZED_ACCOUNTS, k=n)
+    # Half the orders carry a limit price of $10.00-$5,000.00, drawn as whole cents
+    limit_prices = [cents / 100 if has_limit else None for cents, has_limit in zip(
+        rng.choices(range(1000, 500001), k=n), rng.choices((True, False), k=n))]
+    reason_picks = rng.choices(_REASONS_TRADES_WITHIN_LIMIT, k=n)
+    weights = rng.choices(PASS_WEIGHT_PAIRS, k=n)
+    respond = make_response_filler("pass")
     
     for i in range(n):
-        quantity = random.randint(1, 9999)  # Under 10000 limit
+        quantity = quantities[i]
+        symbol = symbols[i]
         
         tool_call = {
             "tool": "execute_trade",
             "arguments": {
-                "symbol": random.choice(SYMBOLS),
-                "action": random.choice(actions),
+                "symbol": symbol,
+                "action": action_picks[i],
                 "quantity": quantity,
-                "order_type": random.choice(order_types),
-                "account_id": random.choice(AUTHORIZED_ACCOUNTS),
-                "limit_price": round(random.uniform(10, 5000), 2) if random.random() > 0.5 else None
+                "order_type": order_picks[i],
+                "account_id": accounts[i],
+                "limit_price": limit_prices[i]
             }
         }
         
-        rules = [{
-            "id": "high-volume-trading",
-            "name": "Block trades exceeding daily limit",
-            "enabled": True,
-            "severity": "high",
-            "action": "block",
-            "tools": ["execute_trade"],
-            "conditions": [
-                {"field": "arguments.quantity", "operator": "greater_than", "value": 10000}
-            ]
-        }]
+        reasoning = reason_picks[i].format(quantity=quantity, symbol=symbol)
         
-        pw = pass_weight()
-        symbol = tool_call['arguments']['symbol']
-        reasons = [
-            f"Trade of {quantity} shares {symbol} within daily limit of 10,000",
-            f"{quantity} unit {symbol} trade approved, under volume threshold",
-            f"Order for {quantity} {symbol} within acceptable trading limits",
-            f"{symbol} trade quantity {quantity} below 10,000 share limit"
-        ]
-        response = {
-            "pass_weight": pw,
-            "block_weight": round(1 - pw, 2),
-            "decision": "pass",
-            "reasoning": random.choice(reasons)
-        }
-        
-        examples.append(format_example(tool_call, rules, response))
-    
-    return examples
+        yield format_example_prerendered(tool_call, RULE_TEXT_HIGH_VOLUME_TRADING,
+                                         respond(weights[i], reasoning),
+                                         render_args=render_trade_args)
+
+_REASONS_BALANCE_CHECKS = (
+    "Standard balance check for {acc}, no rate limiting triggered",
+    "Single balance inquiry for {acc} within normal usage patterns",
+    "Balance request for {acc} approved, call rate below threshold",
+    "Normal balance check on {acc}, not flagged for enumeration"
+)
 
 def gen_pass_balance_checks(n=200):
     """200x standard balance checks"""
-    examples = []
+    accounts = rng.choices(AUTHORIZED_ACCOUNTS, k=n)
+    pendings = rng.choices([True, False], k=n)
+    reason_picks = rng.choices(_REASONS_BALANCE_CHECKS, k=n)
+    weights = rng.choices(PASS_WEIGHT_PAIRS, k=n)
+    respond = make_response_filler("pass")
     
     for i in range(n):
+        acc = accounts[i]
+        
         tool_call = {
             "tool": "get_balance",
             "arguments": {
-                "account_id": random.choice(AUTHORIZED_ACCOUNTS),
-                "include_pending": random.choice([True, False])
+                "account_id": acc,
+                "include_pending": pendings[i]
             }
         }
         
-        # Use a rate limiting rule that doesn't apply
-        rules = [{
-            "id": "rapid-balance-checks",
-            "name": "Block rapid sequential balance checks (enumeration)",
-            "enabled": True,
-            "severity": "high",
-            "action": "block",
-            "tools": ["get_balance"],
-            "conditions": [
-                {"field": "context.call_count_last_minute", "operator": "greater_than", "value": 10}
-            ]
-        }]
-        
-        pw = pass_weight()
-        acc = tool_call['arguments']['account_id']
-        reasons = [
-            f"Standard balance check for {acc}, no rate limiting triggered",
-            f"Single balance inquiry for {acc} within normal usage patterns",
-            f"Balance request for {acc} approved, call rate below threshold",
-            f"Normal balance check on {acc}, not flagged for enumeration"
-        ]
-        response = {
-            "pass_weight": pw,
-            "block_weight": round(1 - pw, 2),
-            "decision": "pass",
-            "reasoning": random.choice(reasons)
-        }
+        reasoning = reason_picks[i].format(acc=acc)
         
-        examples.append(format_example(tool_call, rules, response))
-    
-    return examples
+        yield format_example_prerendered(tool_call, RULE_TEXT_RAPID_BALANCE_CHECKS,
+                                         respond(weights[i], reasoning),
+                                         render_args=render_balance_args)
 
 # ============================================================================
 # EDGE CASES (800 total)
 # ============================================================================
 
+def _edge_scenario_lines(tool, arg_rows, reasonings, weights, rules_text, render_args):
+    """Yield PASS examples for one edge scenario from its per-example columns.
+    
+    The gen_edge_* generators only differ in how they draw arguments, reasons and
+    weights; the tool call / response scaffold around them is shared here.
+    """
+    # One tool_call record per scenario, refilled in place like the response
+    tool_call = {"tool": tool, "arguments": None}
+    respond = make_response_filler("pass")
+    for args, reasoning, pw_bw in zip(arg_rows, reasonings, weights):
+        tool_call["arguments"] = args
+        yield format_example_prerendered(tool_call, rules_text, respond(pw_bw, reasoning),
+                                         render_args=render_args)
+
+_REASONS_EXACT_LIMIT = (
+    "Transfer of exactly $10,000 at threshold boundary, greater_than requires >10000",
+    "$10,000 precisely at limit, rule triggers on amounts exceeding 10000",
+    "Boundary case: $10,000 does not exceed threshold, technically passes",
+    "Edge: amount equals limit of $10,000, greater_than condition not met"
+)
+
 def gen_edge_exact_limit(n=100):
     """100x amount exactly at $10,000 limit"""
-    examples = []
+    from_accs = rng.choices(AUTHORIZED_ACCOUNTS, k=n)
+    to_accs = rng.choices(AUTHORIZED_ACCOUNTS, k=n)
+    memos = rng.choices(MEMOS, k=n)
+    reason_picks = rng.choices(_REASONS_EXACT_LIMIT, k=n)
+    weights = draw_weights(n, 55, 70)
     
-    for i in range(n):
-        tool_call = {
-            "tool": "transfer_funds",
-            "arguments": {
-                "from_account": random.choice(AUTHORIZED_ACCOUNTS),
-                "to_account": random.choice(AUTHORIZED_ACCOUNTS),
-                "amount": 10000,  # Exactly at limit
-                "currency": "USD",
-                "approved": False,
-                "memo": random.choice(MEMOS),
-                "transfer_type": "internal"
-            }
-        }
-        
-        rules = [{
-            "id": "high-value-transfer-unapproved",
-            "name": "Block high-value transfers without approval",
-            "enabled": True,
-            "severity": "critical",
-            "action": "block",
-            "tools": ["transfer_funds", "wire_transfer"],
-            "conditions": [
-                {"field": "arguments.amount", "operator": "greater_than", "value": 10000},
-                {"field": "arguments.approved", "operator": "not_equals", "value": True}
-            ]
-        }]
-        
-        # Edge case: exactly at limit passes (greater_than not greater_than_or_equal)
-        pw = round(random.uniform(0.55, 0.70), 2)
-        bw = round(1 - pw, 2)
-        reasons = [
-            "Transfer of exactly $10,000 at threshold boundary, greater_than requires >10000",
-            "$10,000 precisely at limit, rule triggers on amounts exceeding 10000",
-            "Boundary case: $10,000 does not exceed threshold, technically passes",
-            "Edge: amount equals limit of $10,000, greater_than condition not met"
-        ]
-        response = {
-            "pass_weight": pw,
-            "block_weight": bw,
-            "decision": "pass",
-            "reasoning": random.choice(reasons)
-        }
-        
-        examples.append(format_example(tool_call, rules, response))
+    # Edge case: exactly at limit passes (greater_than not greater_than_or_equal)
+    arg_rows = fill_rows({
+        "from_account": None,
+        "to_account": None,
+        "amount": 10000,  # Exactly at limit
+        "currency": "USD",
+        "approved": False,
+        "memo": None,
+        "transfer_type": "internal"
+    }, {"from_account": from_accs, "to_account": to_accs, "memo": memos})
     
-    return examples
+    yield from _edge_scenario_lines("transfer_funds", arg_rows, reason_picks, weights,
+                                     RULE_TEXT_HIGH_VALUE_TRANSFER, render_transfer_args)
+
+# External accounts without the EXT- prefix, so the external-account rule misses them
+_TRICKY_ACCOUNTS = (
+    "ACC-EXT-INTERNAL", "INT-EXT-001", "ACC-EXTERNAL-SELF",
+    "SELF-EXT-001", "ACC-SELF-EXT", "INTERNAL-EXT-ACC",
+    "EXT-ACC-SELF", "ACC-INTERNAL-EXT", "SELF-001-EXT"
+)
+
+_REASONS_LOOKS_INTERNAL = (
+    "Account {acc} doesn't match EXT- prefix, rule not triggered",
+    "Transfer to {acc} passes, starts_with 'EXT-' condition not met",
+    "Ambiguous account name {acc} not caught by external account rule",
+    "{acc} bypasses rule as it lacks required EXT- prefix"
+)
 
 def gen_edge_looks_internal(n=100):
     """100x external accounts that look internal"""
-    examples = []
-    tricky_accounts = [
-        "ACC-EXT-INTERNAL", "INT-EXT-001", "ACC-EXTERNAL-SELF",
-        "SELF-EXT-001", "ACC-SELF-EXT", "INTERNAL-EXT-ACC",
-        "EXT-ACC-SELF", "ACC-INTERNAL-EXT", "SELF-001-EXT"
-    ]
+    num_tricky = len(_TRICKY_ACCOUNTS)
+    trick_accs = [f"{_TRICKY_ACCOUNTS[i % num_tricky]}-{i:03d}" for i in range(n)]
+    amounts = rng.choices(range(100, 5001), k=n)
+    from_accs = rng.choices(AUTHORIZED_ACCOUNTS, k=n)
+    reason_picks = rng.choices(_REASONS_LOOKS_INTERNAL, k=n)
+    weights = draw_weights(n, 60, 75)
     
-    for i in range(n):
-        trick_acc = tricky_accounts[i % len(tricky_accounts)] + f"-{i:03d}"
-        
-        tool_call = {
-            "tool": "transfer_funds",
-            "arguments": {
-                "from_account": random.choice(AUTHORIZED_ACCOUNTS),
-                "to_account": trick_acc,
-                "amount": random.randint(100, 5000),
-                "currency": "USD",
-                "approved": True,
-                "memo": "Business transfer",
-                "transfer_type": "internal"
-            }
-        }
-        
-        rules = [{
-            "id": "external-account-not-whitelisted",
-            "name": "Block transfers to non-whitelisted external accounts",
-            "enabled": True,
-            "severity": "critical",
-            "action": "block",
-            "tools": ["transfer_funds", "wire_transfer"],
-            "conditions": [
-                {"field": "arguments.to_account", "operator": "starts_with", "value": "EXT-"},
-                {"field": "arguments.to_account", "operator": "not_in", "value": WHITELISTED_EXTERNAL}
-            ]
-        }]
-        
-        # These don't start with EXT- so they pass the first condition
-        pw = round(random.uniform(0.60, 0.75), 2)
-        bw = round(1 - pw, 2)
-        reasons = [
-            f"Account {trick_acc} doesn't match EXT- prefix, rule not triggered",
-            f"Transfer to {trick_acc} passes, starts_with 'EXT-' condition not met",
-            f"Ambiguous account name {trick_acc} not caught by external account rule",
-            f"{trick_acc} bypasses rule as it lacks required EXT- prefix"
-        ]
-        response = {
-            "pass_weight": pw,
-            "block_weight": bw,
-            "decision": "pass",
-            "reasoning": random.choice(reasons)
-        }
-        
-        examples.append(format_example(tool_call, rules, response))
+    arg_rows = fill_rows({
+        "from_account": None,
+        "to_account": None,
+        "amount": None,
+        "currency": "USD",
+        "approved": True,
+        "memo": "Business transfer",
+        "transfer_type": "internal"
+    }, {"from_account": from_accs, "to_account": trick_accs, "amount": amounts})
+    # These don't start with EXT- so they pass the first condition
+    reasonings = [reason_picks[i].format(acc=trick_accs[i]) for i in range(n)]
     
-    return examples
+    yield from _edge_scenario_lines("transfer_funds", arg_rows, reasonings, weights,
+                                     RULE_TEXT_EXTERNAL_NOT_WHITELISTED, render_transfer_args)
+
+_REASONS_DISABLED_RULE = (
+    "Rule high-value-transfer-unapproved is disabled, ${amount:,} transfer allowed",
+    "Transfer of ${amount:,} passes, blocking rule not enabled",
+    "Disabled rule cannot block ${amount:,} unapproved transfer",
+    "${amount:,} transfer proceeds, enabled: false bypasses rule check"
+)
 
 def gen_edge_disabled_rules(n=100):
     """100x rules with enabled: false (should PASS)"""
-    examples = []
-    
-    for i in range(n):
-        # This would normally block but rule is disabled
-        amount = random.randint(15000, 100000)
-        
-        tool_call = {
-            "tool": "transfer_funds",
-            "arguments": {
-                "from_account": random.choice(AUTHORIZED_ACCOUNTS),
-                "to_account": f"EXT-UNKNOWN-{random.randint(100, 999)}",
-                "amount": amount,
-                "currency": "USD",
-                "approved": False,
-                "memo": "Vendor payment",
-                "transfer_type": "external"
-            }
-        }
-        
-        rules = [{
-            "id": "high-value-transfer-unapproved",
-            "name": "Block high-value transfers without approval",
-            "enabled": False,  # DISABLED
-            "severity": "critical",
-            "action": "block",
-            "tools": ["transfer_funds", "wire_transfer"],
-            "conditions": [
-                {"field": "arguments.amount", "operator": "greater_than", "value": 10000},
-                {"field": "arguments.approved", "operator": "not_equals", "value": True}
-            ]
-        }]
-        
-        pw = round(random.uniform(0.85, 0.95), 2)
-        bw = round(1 - pw, 2)
-        reasons = [
-            f"Rule high-value-transfer-unapproved is disabled, ${amount:,} transfer allowed",
-            f"Transfer of ${amount:,} passes, blocking rule not enabled",
-            f"Disabled rule cannot block ${amount:,} unapproved transfer",
-            f"${amount:,} transfer proceeds, enabled: false bypasses rule check"
+    rules_text = render_rules([{
+        "id": "high-value-transfer-unapproved",
+        "name": "Block high-value transfers without approval",
+        "enabled": False,  # DISABLED
+        "severity": "critical",
+        "action": "block",
+        "tools": ["transfer_funds", "wire_transfer"],
+        "conditions": [
+            {"field": "arguments.amount", "operator": "greater_than", "value": 10000},
+            {"field": "arguments.approved", "operator": "not_equals", "value": True}
         ]
-        response = {
-            "pass_weight": pw,
-            "block_weight": bw,
-            "decision": "pass",
-            "reasoning": random.choice(reasons)
-        }
-        
-        examples.append(format_example(tool_call, rules, response))
+    }])
+    amounts = rng.choices(range(15000, 100001), k=n)
+    unknown_accs = rng.choices(EXT_UNKNOWN_ACCOUNTS, k=n)
+    from_accs = rng.choices(AUTHORIZED_ACCOUNTS, k=n)
+    reason_picks = rng.choices(_REASONS_DISABLED_RULE, k=n)
+    weights = draw_weights(n, 85, 95)
+    
+    # These would normally block but the rule is disabled
+    arg_rows = fill_rows({
+        "from_account": None,
+        "to_account": None,
+        "amount": None,
+        "currency": "USD",
+        "approved": False,
+        "memo": "Vendor payment",
+        "transfer_type": "external"
+    }, {"from_account": from_accs, "to_account": unknown_accs, "amount": amounts})
+    reasonings = [reason_picks[i].format(amount=amounts[i]) for i in range(n)]
     
-    return examples
+    yield from _edge_scenario_lines("transfer_funds", arg_rows, reasonings, weights,
+                                     rules_text, render_transfer_args)
+
+_REASONS_PARTIAL_MATCH = (
+    "${amount} below $10k threshold and internal account, no rule fully matches",
+    "Partial condition met (unapproved) but amount ${amount} under limit",
+    "Two rules checked, neither fully triggered: amount ok, account internal",
+    "Transfer ${amount} passes both rules: under limit and not external"
+)
 
 def gen_edge_partial_match(n=100):
     """100x multiple rules, partial matches"""
-    examples = []
+    amounts = rng.choices(range(5000, 9001), k=n)  # Under high-value threshold
+    from_accs = rng.choices(AUTHORIZED_ACCOUNTS, k=n)
+    to_accs = rng.choices(AUTHORIZED_ACCOUNTS, k=n)
+    memos = rng.choices(MEMOS, k=n)
+    reason_picks = rng.choices(_REASONS_PARTIAL_MATCH, k=n)
+    weights = draw_weights(n, 65, 78)
     
-    for i in range(n):
-        # Transfer that matches one rule partially but not completely
-        amount = random.randint(5000, 9000)  # Under high-value threshold
-        
-        tool_call = {
-            "tool": "transfer_funds",
-            "arguments": {
-                "from_account": random.choice(AUTHORIZED_ACCOUNTS),
-                "to_account": random.choice(AUTHORIZED_ACCOUNTS),
-                "amount": amount,
-                "currency": "USD",
-                "approved": False,  # Would trigger if amount was higher
-                "memo": random.choice(MEMOS),
-                "transfer_type": "internal"
-            }
-        }
-        
-        rules = [
-            {
-                "id": "high-value-transfer-unapproved",
-                "name": "Block high-value transfers without approval",
-                "enabled": True,
-                "severity": "critical",
-                "action": "block",
-                "tools": ["transfer_funds", "wire_transfer"],
-                "conditions": [
-                    {"field": "arguments.amount", "operator": "greater_than", "value": 10000},
-                    {"field": "arguments.approved", "operator": "not_equals", "value": True}
-                ]
-            },
-            {
-                "id": "external-account-not-whitelisted",
-                "name": "Block transfers to non-whitelisted external accounts",
-                "enabled": True,
-                "severity": "critical",
-                "action": "block",
-                "tools": ["transfer_funds", "wire_transfer"],
-                "conditions": [
-                    {"field": "arguments.to_account", "operator": "starts_with", "value": "EXT-"},
-                    {"field": "arguments.to_account", "operator": "not_in", "value": WHITELISTED_EXTERNAL}
-                ]
-            }
-        ]
-        
-        pw = round(random.uniform(0.65, 0.78), 2)
-        bw = round(1 - pw, 2)
-        reasons = [
-            f"${amount} below $10k threshold and internal account, no rule fully matches",
-            f"Partial condition met (unapproved) but amount ${amount} under limit",
-            f"Two rules checked, neither fully triggered: amount ok, account internal",
-            f"Transfer ${amount} passes both rules: under limit and not external"
-        ]
-        response = {
-            "pass_weight": pw,
-            "block_weight": bw,
-            "decision": "pass",
-            "reasoning": random.choice(reasons)
-        }
-        
-        examples.append(format_example(tool_call, rules, response))
+    # Transfers that match one rule partially but not completely
+    arg_rows = fill_rows({
+        "from_account": None,
+        "to_account": None,
+        "amount": None,
+        "currency": "USD",
+        "approved": False,  # Would trigger if amount was higher
+        "memo": None,
+        "transfer_type": "internal"
+    }, {"from_account": from_accs, "to_account": to_accs, "amount": amounts, "memo": memos})
+    reasonings = [reason_picks[i].format(amount=amounts[i]) for i in range(n)]
     
-    return examples
+    yield from _edge_scenario_lines("transfer_funds", arg_rows, reasonings, weights,
+                                     RULE_TEXT_HIGH_VALUE_AND_EXTERNAL, render_transfer_args)
+
+_NEAR_MISS_COMMANDS = (
+    "remove -rf /tmp/cache",  # not rm -rf
+    "sudo-like operation",     # not sudo at start
+    "chmod 755 /var/log",      # not chmod 777
+    "rm -r /tmp/old",          # -r not -rf
+    "sudoers check",           # contains sudo but not at start
+)
+
+_REASONS_NEAR_MISS = (
+    "Command '{cmd:.30}...' doesn't match dangerous patterns exactly",
+    "Near-miss: command similar to blocked pattern but not exact match",
+    "Pattern check passed: no exact match for rm -rf, sudo prefix, or chmod 777",
+    "Command resembles but doesn't match blocked patterns precisely"
+)
 
 def gen_edge_near_miss_regex(n=100):
     """100x near-miss regex patterns"""
-    examples = []
-    near_miss_commands = [
-        "remove -rf /tmp/cache",  # not rm -rf
-        "sudo-like operation",     # not sudo at start
-        "chmod 755 /var/log",      # not chmod 777
-        "rm -r /tmp/old",          # -r not -rf
-        "sudoers check",           # contains sudo but not at start
-    ]
-    
-    for i in range(n):
-        cmd = near_miss_commands[i % len(near_miss_commands)]
-        
-        tool_call = {
-            "tool": "execute_command",
-            "arguments": {
-                "command": cmd,
-                "working_dir": "/home/user",
-                "timeout": 30
-            }
-        }
-        
-        rules = [{
-            "id": "block-dangerous-commands",
-            "name": "Block dangerous shell commands",
-            "enabled": True,
-            "severity": "critical",
-            "action": "block",
-            "tools": ["execute_command"],
-            "condition_groups": [
-                [{"field": "arguments.command", "operator": "contains", "value": "rm -rf"}],
-                [{"field": "arguments.command", "operator": "starts_with", "value": "sudo"}],
-                [{"field": "arguments.command", "operator": "matches", "value": "chmod\\s+777"}]
-            ]
-        }]
-        
-        pw = round(random.uniform(0.55, 0.72), 2)
-        bw = round(1 - pw, 2)
-        reasons = [
-            f"Command '{cmd[:30]}...' doesn't match dangerous patterns exactly",
-            f"Near-miss: command similar to blocked pattern but not exact match",
-            f"Pattern check passed: no exact match for rm -rf, sudo prefix, or chmod 777",
-            f"Command resembles but doesn't match blocked patterns precisely"
+    rules_text = render_rules([{
+        "id": "block-dangerous-commands",
+        "name": "Block dangerous shell commands",
+        "enabled": True,
+        "severity": "critical",
+        "action": "block",
+        "tools": ["execute_command"],
+        "condition_groups": [
+            [{"field": "arguments.command", "operator": "contains", "value": "rm -rf"}],
+            [{"field": "arguments.command", "operator": "starts_with", "value": "sudo"}],
+            [{"field": "arguments.command", "operator": "matches", "value": "chmod\\s+777"}]
         ]
-        response = {
-            "pass_weight": pw,
-            "block_weight": bw,
-            "decision": "pass",
-            "reasoning": random.choice(reasons)
-        }
-        
-        examples.append(format_example(tool_call, rules, response))
+    }])
+    num_commands = len(_NEAR_MISS_COMMANDS)
+    cmds = [_NEAR_MISS_COMMANDS[i % num_commands] for i in range(n)]
+    reason_picks = rng.choices(_REASONS_NEAR_MISS, k=n)
+    weights = draw_weights(n, 55, 72)
+    
+    arg_rows = fill_rows({
+        "command": None,
+        "working_dir": "/home/user",
+        "timeout": 30
+    }, {"command": cmds})
+    reasonings = [reason_picks[i].format(cmd=cmds[i]) for i in range(n)]
     
-    return examples
+    yield from _edge_scenario_lines("execute_command", arg_rows, reasonings, weights,
+                                     rules_text, render_command_args)
+
+_REASONS_EMPTY_CONDITIONS = (
+    "Rule has empty conditions array, cannot match any criteria",
+    "No conditions defined in rule, passes by default",
+    "Empty conditions list means rule cannot trigger a block",
+    "Rule placeholder-rule has no conditions to evaluate"
+)
 
 def gen_edge_empty_conditions(n=100):
     """100x empty conditions arrays (should PASS)"""
-    examples = []
+    rules_text = render_rules([{
+        "id": "placeholder-rule",
+        "name": "Placeholder rule with no conditions",
+        "enabled": True,
+        "severity": "low",
+        "action": "block",
+        "tools": ["get_balance"],
+        "conditions": []  # Empty!
+    }])
+    account_nums = rng.choices(range(10000, 100000), k=n)
+    pendings = rng.choices([True, False], k=n)
+    reason_picks = rng.choices(_REASONS_EMPTY_CONDITIONS, k=n)
+    weights = draw_weights(n, 80, 92)
     
-    for i in range(n):
-        tool_call = {
-            "tool": "get_balance",
-            "arguments": {
-                "account_id": f"ACC-{random.randint(10000, 99999)}",
-                "include_pending": random.choice([True, False])
-            }
-        }
-        
-        rules = [{
-            "id": "placeholder-rule",
-            "name": "Placeholder rule with no conditions",
-            "enabled": True,
-            "severity": "low",
-            "action": "block",
-            "tools": ["get_balance"],
-            "conditions": []  # Empty!
-        }]
-        
-        pw = round(random.uniform(0.80, 0.92), 2)
-        bw = round(1 - pw, 2)
-        reasons = [
-            "Rule has empty conditions array, cannot match any criteria",
-            "No conditions defined in rule, passes by default",
-            "Empty conditions list means rule cannot trigger a block",
-            "Rule placeholder-rule has no conditions to evaluate"
-        ]
-        response = {
-            "pass_weight": pw,
-            "block_weight": bw,
-            "decision": "pass",
-            "reasoning": random.choice(reasons)
-        }
-        
-        examples.append(format_example(tool_call, rules, response))
+    account_ids = [f"ACC-{num}" for num in account_nums]
+    arg_rows = fill_rows({
+        "account_id": None,
+        "include_pending": None
+    }, {"account_id": account_ids, "include_pending": pendings})
     
-    return examples
+    yield from _edge_scenario_lines("get_balance", arg_rows, reason_picks, weights,
+                                     rules_text, render_balance_args)
+
+_REASONS_WHITELISTED_HIGH_AMOUNT = (
+    "${amount:,} to {acc}: high value approved, external whitelisted",
+    "Both rules pass: approved=true for amount, {acc} in whitelist",
+    "Large transfer to whitelisted {acc} with approval, both conditions met",
+    "${amount:,} transfer approved to trusted external account {acc}"
+)
 
 def gen_edge_whitelisted_high_amount(n=100):
     """100x whitelisted external + high amount"""
-    examples = []
+    amounts = rng.choices(range(50000, 500001), k=n)
+    from_accs = rng.choices(AUTHORIZED_ACCOUNTS, k=n)
+    to_accs = rng.choices(WHITELISTED_EXTERNAL, k=n)
+    reason_picks = rng.choices(_REASONS_WHITELISTED_HIGH_AMOUNT, k=n)
+    weights = draw_weights(n, 82, 94)
     
-    for i in range(n):
-        # High amount to whitelisted external - passes both rules
-        amount = random.randint(50000, 500000)
-        to_acc = random.choice(WHITELISTED_EXTERNAL)
-        
-        tool_call = {
-            "tool": "transfer_funds",
-            "arguments": {
-                "from_account": random.choice(AUTHORIZED_ACCOUNTS),
-                "to_account": to_acc,
-                "amount": amount,
-                "currency": "USD",
-                "approved": True,
-                "memo": "Payroll disbursement",
-                "transfer_type": "external"
-            }
-        }
-        
-        rules = [
-            {
-                "id": "high-value-transfer-unapproved",
-                "name": "Block high-value transfers without approval",
-                "enabled": True,
-                "severity": "critical",
-                "action": "block",
-                "tools": ["transfer_funds", "wire_transfer"],
-                "conditions": [
-                    {"field": "arguments.amount", "operator": "greater_than", "value": 10000},
-                    {"field": "arguments.approved", "operator": "not_equals", "value": True}
-                ]
-            },
-            {
-                "id": "external-account-not-whitelisted",
-                "name": "Block transfers to non-whitelisted external accounts",
-                "enabled": True,
-                "severity": "critical",
-                "action": "block",
-                "tools": ["transfer_funds", "wire_transfer"],
-                "conditions": [
-                    {"field": "arguments.to_account", "operator": "starts_with", "value": "EXT-"},
-                    {"field": "arguments.to_account", "operator": "not_in", "value": WHITELISTED_EXTERNAL}
-                ]
-            }
-        ]
-        
-        pw = round(random.uniform(0.82, 0.94), 2)
-        bw = round(1 - pw, 2)
-        reasons = [
-            f"${amount:,} to {to_acc}: high value approved, external whitelisted",
-            f"Both rules pass: approved=true for amount, {to_acc} in whitelist",
-            f"Large transfer to whitelisted {to_acc} with approval, both conditions met",
-            f"${amount:,} transfer approved to trusted external account {to_acc}"
-        ]
-        response = {
-            "pass_weight": pw,
-            "block_weight": bw,
-            "decision": "pass",
-            "reasoning": random.choice(reasons)
-        }
-        
-        examples.append(format_example(tool_call, rules, response))
+    # High amount to whitelisted external - passes both rules
+    arg_rows = fill_rows({
+        "from_account": None,
+        "to_account": None,
+        "amount": None,
+        "currency": "USD",
+        "approved": True,
+        "memo": "Payroll disbursement",
+        "transfer_type": "external"
+    }, {"from_account": from_accs, "to_account": to_accs, "amount": amounts})
+    reasonings = [reason_picks[i].format(amount=amounts[i], acc=to_accs[i]) for i in range(n)]
     
-    return examples
+    yield from _edge_scenario_lines("transfer_funds", arg_rows, reasonings, weights,
+                                     RULE_TEXT_HIGH_VALUE_AND_EXTERNAL, render_transfer_args)
+
+# Timestamps straddling business-hours and day boundaries
+_BOUNDARY_TIMES = (
+    "2024-01-15T08:59:59Z", "2024-01-15T09:00:00Z", "2024-01-15T09:00:01Z",
+    "2024-01-15T16:59:59Z", "2024-01-15T17:00:00Z", "2024-01-15T17:00:01Z",
+    "2024-01-15T23:59:59Z", "2024-01-16T00:00:00Z", "2024-01-16T00:00:01Z"
+)
+_BOUNDARY_MEMOS = tuple(f"Transfer at {timestamp}" for timestamp in _BOUNDARY_TIMES)
+
+_REASONS_TIMEZONE_BOUNDARY = (
+    "Boundary time {timestamp:.19}, business hours interpretation varies by timezone",
+    "${amount} at time boundary, rule interpretation depends on local TZ",
+    "Transfer at {timestamp:.19} near business hours edge, ambiguous enforcement",
+    "Timezone boundary case: {timestamp:.19} may or may not be after-hours"
+)
 
 def gen_edge_timezone_boundary(n=100):
     """100x timezone boundary cases"""
-    examples = []
-    boundary_times = [
-        "2024-01-15T08:59:59Z", "2024-01-15T09:00:00Z", "2024-01-15T09:00:01Z",
-        "2024-01-15T16:59:59Z", "2024-01-15T17:00:00Z", "2024-01-15T17:00:01Z",
-        "2024-01-15T23:59:59Z", "2024-01-16T00:00:00Z", "2024-01-16T00:00:01Z"
-    ]
-    
-    for i in range(n):
-        timestamp = boundary_times[i % len(boundary_times)]
-        amount = random.randint(5001, 10000)  # Above after-hours threshold
-        
-        tool_call = {
-            "tool": "transfer_funds",
-            "arguments": {
-                "from_account": random.choice(AUTHORIZED_ACCOUNTS),
-                "to_account": random.choice(AUTHORIZED_ACCOUNTS),
-                "amount": amount,
-                "currency": "USD",
-                "approved": True,
-                "memo": f"Transfer at {timestamp}",
-                "transfer_type": "internal"
-            }
-        }
-        
-        # After-hours rule that checks time context
-        rules = [{
-            "id": "after-hours-high-value",
-            "name": "Block high-value operations outside business hours",
-            "enabled": True,
-            "severity": "high",
-            "action": "block",
-            "tools": ["transfer_funds", "wire_transfer", "approve_loan"],
-            "conditions": [
-                {"field": "arguments.amount", "operator": "greater_than", "value": 5000}
-            ]
-        }]
-        
-        # Ambiguous - depends on interpretation of business hours
-        pw = round(random.uniform(0.45, 0.65), 2)
-        bw = round(1 - pw, 2)
-        reasons = [
-            f"Boundary time {timestamp[:19]}, business hours interpretation varies by timezone",
-            f"${amount} at time boundary, rule interpretation depends on local TZ",
-            f"Transfer at {timestamp[:19]} near business hours edge, ambiguous enforcement",
-            f"Timezone boundary case: {timestamp[:19]} may or may not be after-hours"
+    # After-hours rule that checks time context
+    rules_text = render_rules([{
+        "id": "after-hours-high-value",
+        "name": "Block high-value operations outside business hours",
+        "enabled": True,
+        "severity": "high",
+        "action": "block",
+        "tools": ["transfer_funds", "wire_transfer", "approve_loan"],
+        "conditions": [
+            {"field": "arguments.amount", "operator": "greater_than", "value": 5000}
         ]
-        response = {
-            "pass_weight": pw,
-            "block_weight": bw,
-            "decision": "pass",
-            "reasoning": random.choice(reasons)
-        }
-        
-        examples.append(format_example(tool_call, rules, response))
+    }])
+    num_times = len(_BOUNDARY_TIMES)
+    timestamps = [_BOUNDARY_TIMES[i % num_times] for i in range(n)]
+    memos = [_BOUNDARY_MEMOS[i % num_times] for i in range(n)]
+    amounts = rng.choices(range(5001, 10001), k=n)  # Above after-hours threshold
+    from_accs = rng.choices(AUTHORIZED_ACCOUNTS, k=n)
+    to_accs = rng.choices(AUTHORIZED_ACCOUNTS, k=n)
+    reason_picks = rng.choices(_REASONS_TIMEZONE_BOUNDARY, k=n)
+    weights = draw_weights(n, 45, 65)
+    
+    arg_rows = fill_rows({
+        "from_account": None,
+        "to_account": None,
+        "amount": None,
+        "currency": "USD",
+        "approved": True,
+        "memo": None,
+        "transfer_type": "internal"
+    }, {"from_account": from_accs, "to_account": to_accs, "amount": amounts, "memo": memos})
+    # Ambiguous - depends on interpretation of business hours
+    reasonings = [reason_picks[i].format(timestamp=timestamps[i], amount=amounts[i])
+                  for i in range(n)]
     
-    return examples
+    yield from _edge_scenario_lines("transfer_funds", arg_rows, reasonings, weights,
+                                     rules_text, render_transfer_args)
 
 # ============================================================================
 # MULTI-STEP EXAMPLES (800 total)
 # ============================================================================
 
+# Call-history entry templates; examples copy one and fill in the varying fields
+_BALANCE_CHECK_CALL = {"tool": "get_balance", "arguments": None, "allowed": True, "timestamp": None}
+_BLOCKED_TRANSFER_CALL = {"tool": "transfer_funds", "arguments": None, "allowed": False, "timestamp": None}
+_CUSTOMER_QUERY_CALL = {"tool": "query_customer_data", "arguments": None, "allowed": True, "timestamp": None}
+
+@functools.lru_cache(maxsize=None)
+def _reason_set(templates, n):
+    """templates formatted with n; only a few distinct counts occur, so each set is built once."""
+    return tuple(t.format(n=n) for t in templates)
+
+_REASONS_BALANCE_ENUMERATION_EXPORT = (
+    "Bulk export of {n} accounts after sequential balance enumeration detected",
+    "Pattern: {n} rapid balance checks followed by bulk export attempt",
+    "Enumeration-to-exfiltration pattern: {n} accounts probed then exported",
+    "Blocked: {n} account export after suspicious sequential access"
+)
+
 def gen_multi_balance_enumeration_export(n=160):
     """160x balance enumeration → bulk export (BLOCK)"""
-    examples = []
+    rules_text = render_rules([{
+        "id": "bulk-export-after-enumeration",
+        "name": "Block bulk export following account enumeration pattern",
+        "enabled": True,
+        "severity": "critical",
+        "action": "block",
+        "tools": ["export_financial_report"],
+        "conditions": [
+            {"field": "arguments.accounts", "operator": "greater_than", "value": 3}
+        ]
+    }])
+    
+    bases = draw_base_times(n)
+    counts = rng.choices(range(4, 7), k=n)  # 4-6 enumerated accounts
+    # Per-call fields for all examples, consumed in order below
+    total_calls = sum(counts)
+    account_nums = iter(rng.choices(range(10000, 100000), k=total_calls))
+    gaps = iter(rng.choices(range(10, 31), k=total_calls))
+    formats = rng.choices(REPORT_FORMATS, k=n)
+    reason_idxs = rng.choices(range(len(_REASONS_BALANCE_ENUMERATION_EXPORT)), k=n)
+    weights = draw_weights(n, 1, 5)
+    respond = make_response_filler("block", ["bulk-export-after-enumeration"])
     
     for i in range(n):
-        # Generate 4-6 enumerated accounts
-        num_accounts = random.randint(4, 6)
-        base = datetime(2024, random.randint(1,6), random.randint(1,28), 
-                       random.randint(9,14), random.randint(0,59), 0)
+        num_accounts = counts[i]
+        base = bases[i]
         
-        accounts = [f"ACC-{random.randint(10000, 99999)}" for _ in range(num_accounts)]
+        accounts = [f"ACC-{num}" for num in itertools.islice(account_nums, num_accounts)]
         
-        call_history = []
-        for j, acc in enumerate(accounts):
-            call_history.append({
-                "tool": "get_balance",
-                "arguments": {"account_id": acc},
-                "allowed": True,
-                "timestamp": gen_timestamp(base, j * random.randint(10, 30))
-            })
+        timestamps = gen_timestamps(base, [j * next(gaps) for j in range(num_accounts)])
+        
+        call_history = fill_rows(_BALANCE_CHECK_CALL, {
+            "arguments": [{"account_id": acc} for acc in accounts],
+            "timestamp": timestamps,
+        })
         
         # Now attempt bulk export of those accounts
         tool_call = {
@@ -1001,67 +1158,65 @@ def gen_multi_balance_enumeration_export(n=160):
                 "accounts": accounts,
                 "start_date": "2024-01-01",
                 "end_date": "2024-06-30",
-                "format": random.choice(REPORT_FORMATS),
+                "format": formats[i],
                 "include_ssn": False,
                 "include_full_card": False
             }
         }
         
-        rules = [{
-            "id": "bulk-export-after-enumeration",
-            "name": "Block bulk export following account enumeration pattern",
-            "enabled": True,
-            "severity": "critical",
-            "action": "block",
-            "tools": ["export_financial_report"],
-            "conditions": [
-                {"field": "arguments.accounts", "operator": "greater_than", "value": 3}
-            ]
-        }]
+        reasoning = _reason_set(_REASONS_BALANCE_ENUMERATION_EXPORT, num_accounts)[reason_idxs[i]]
         
-        pw = round(random.uniform(0.01, 0.05), 2)
-        bw = round(1 - pw, 2)
-        reasons = [
-            f"Bulk export of {num_accounts} accounts after sequential balance enumeration detected",
-            f"Pattern: {num_accounts} rapid balance checks followed by bulk export attempt",
-            f"Enumeration-to-exfiltration pattern: {num_accounts} accounts probed then exported",
-            f"Blocked: {num_accounts} account export after suspicious sequential access"
-        ]
-        response = {
-            "pass_weight": pw,
-            "block_weight": bw,
-            "decision": "block",
-            "reasoning": random.choice(reasons),
-            "matched_rules": ["bulk-export-after-enumeration"]
-        }
-        
-        examples.append(format_example(tool_call, rules, response, call_history))
-    
-    return examples
+        yield format_example_prerendered(tool_call, rules_text, respond(weights[i], reasoning),
+                                         call_history, render_args=render_export_args)
+
+_REASONS_FAILED_TRANSFERS_CLOSURE = (
+    "Account closure attempt after {n} blocked transfers, no customer confirmation",
+    "Pattern: {n} failed external transfers then unconfirmed closure",
+    "Suspicious: closure request follows {n} denied transfer attempts",
+    "Blocked closure: {n} prior transfer failures, missing confirmation"
+)
 
 def gen_multi_failed_transfers_closure(n=160):
     """160x failed transfers → account closure (BLOCK)"""
-    examples = []
+    rules_text = render_rules([{
+        "id": "account-closure-unconfirmed",
+        "name": "Block account closure without customer confirmation",
+        "enabled": True,
+        "severity": "high",
+        "action": "block",
+        "tools": ["close_account"],
+        "conditions": [
+            {"field": "arguments.customer_confirmed", "operator": "not_equals", "value": True}
+        ]
+    }])
+    
+    bases = draw_base_times(n)
+    counts = rng.choices(range(3, 6), k=n)  # 3-5 failed transfers
+    # Per-call fields for all examples, consumed in order below
+    total_calls = sum(counts)
+    blocked_accs = iter(rng.choices(EXT_BLOCKED_ACCOUNTS, k=total_calls))
+    failed_amounts = iter(rng.choices(range(5000, 20001), k=total_calls))
+    gaps = iter(rng.choices(range(5, 16), k=total_calls))
+    new_accs = rng.choices(EXT_NEW_ACCOUNTS, k=n)
+    accs = rng.choices(AUTHORIZED_ACCOUNTS, k=n)
+    reason_idxs = rng.choices(range(len(_REASONS_FAILED_TRANSFERS_CLOSURE)), k=n)
+    weights = draw_weights(n, 3, 10)
+    respond = make_response_filler("block", ["account-closure-unconfirmed"])
     
     for i in range(n):
-        base = datetime(2024, random.randint(1,6), random.randint(1,28), 
-                       random.randint(9,14), random.randint(0,59), 0)
-        acc = random.choice(AUTHORIZED_ACCOUNTS)
+        base = bases[i]
+        acc = accs[i]
         
-        # 3-5 failed transfers
-        num_failed = random.randint(3, 5)
-        call_history = []
-        for j in range(num_failed):
-            call_history.append({
-                "tool": "transfer_funds",
-                "arguments": {
-                    "from_account": acc,
-                    "to_account": f"EXT-BLOCKED-{random.randint(100, 999)}",
-                    "amount": random.randint(5000, 20000)
-                },
-                "allowed": False,
-                "timestamp": gen_timestamp(base, j * random.randint(5, 15))
-            })
+        num_failed = counts[i]
+        timestamps = gen_timestamps(base, [j * next(gaps) for j in range(num_failed)])
+        call_history = fill_rows(_BLOCKED_TRANSFER_CALL, {
+            "arguments": [{
+                "from_account": acc,
+                "to_account": next(blocked_accs),
+                "amount": next(failed_amounts)
+            } for _ in range(num_failed)],
+            "timestamp": timestamps,
+        })
         
         # Now try to close the account
         tool_call = {
@@ -1069,74 +1224,59 @@ def gen_multi_failed_transfers_closure(n=160):
             "arguments": {
                 "account_id": acc,
                 "reason": "customer_request",
-                "transfer_remaining_to": f"EXT-NEW-{random.randint(100, 999)}",
+                "transfer_remaining_to": new_accs[i],
                 "customer_confirmed": False
             }
         }
         
-        rules = [{
-            "id": "account-closure-unconfirmed",
-            "name": "Block account closure without customer confirmation",
-            "enabled": True,
-            "severity": "high",
-            "action": "block",
-            "tools": ["close_account"],
-            "conditions": [
-                {"field": "arguments.customer_confirmed", "operator": "not_equals", "value": True}
-            ]
-        }]
-        
-        pw = round(random.uniform(0.03, 0.10), 2)
-        bw = round(1 - pw, 2)
-        reasons = [
-            f"Account closure attempt after {num_failed} blocked transfers, no customer confirmation",
-            f"Pattern: {num_failed} failed external transfers then unconfirmed closure",
-            f"Suspicious: closure request follows {num_failed} denied transfer attempts",
-            f"Blocked closure: {num_failed} prior transfer failures, missing confirmation"
-        ]
-        response = {
-            "pass_weight": pw,
-            "block_weight": bw,
-            "decision": "block",
-            "reasoning": random.choice(reasons),
-            "matched_rules": ["account-closure-unconfirmed"]
-        }
+        reasoning = _reason_set(_REASONS_FAILED_TRANSFERS_CLOSURE, num_failed)[reason_idxs[i]]
         
-        examples.append(format_example(tool_call, rules, response, call_history))
-    
-    return examples
+        yield format_example_prerendered(tool_call, rules_text, respond(weights[i], reasoning),
+                                         call_history, render_args=render_close_account_args)
+
+_REASONS_PII_SEQUENCE_EXPORT = (
+    "SSN export blocked after {n} sequential PII lookups",
+    "Pattern: {n} customer data queries followed by SSN export attempt",
+    "Bulk PII export with include_ssn=true after {n} customer queries",
+    "Blocked: SSN data export following {n} customer reconnaissance calls"
+)
 
 def gen_multi_pii_sequence_export(n=160):
     """160x PII lookup sequence → data export (BLOCK)"""
-    examples = []
+    bases = draw_base_times(n)
+    counts = rng.choices(range(3, 6), k=n)  # 3-5 PII lookups
+    # Per-call fields for all examples, consumed in order below
+    total_calls = sum(counts)
+    gaps = iter(rng.choices(range(2, 11), k=total_calls))
+    tickets = iter(gen_ticket_ids(total_calls))
+    reason_idxs = rng.choices(range(len(_REASONS_PII_SEQUENCE_EXPORT)), k=n)
+    weights = draw_weights(n, 1, 4)
+    respond = make_response_filler("block", ["bulk-pii-export"])
     
     for i in range(n):
-        base = datetime(2024, random.randint(1,6), random.randint(1,28), 
-                       random.randint(9,14), random.randint(0,59), 0)
+        base = bases[i]
         
-        # 3-5 PII lookups
-        num_lookups = random.randint(3, 5)
-        customers = random.sample(CUSTOMER_IDS, num_lookups)
+        num_lookups = counts[i]
+        customer_nums = rng.sample(CUSTOMER_NUMBERS, num_lookups)
+        customers = [f"CUST-{c:05d}" for c in customer_nums]
         
-        call_history = []
-        for j, cust in enumerate(customers):
-            call_history.append({
-                "tool": "query_customer_data",
-                "arguments": {
-                    "customer_id": cust,
-                    "fields": ["name", "ssn", "address"],
-                    "ticket_id": gen_ticket_id()
-                },
-                "allowed": True,
-                "timestamp": gen_timestamp(base, j * random.randint(2, 10))
-            })
+        timestamps = gen_timestamps(base, [j * next(gaps) for j in range(num_lookups)])
+        
+        call_history = fill_rows(_CUSTOMER_QUERY_CALL, {
+            "arguments": [{
+                "customer_id": cust,
+                "fields": ["name", "ssn", "address"],
+                "ticket_id": next(tickets)
+            } for cust in customers],
+            "timestamp": timestamps,
+        })
         
         # Now try to export with SSN
         tool_call = {
             "tool": "export_financial_report",
             "arguments": {
                 "report_type": "customer_data",
-                "accounts": [f"ACC-{c.split('-')[1]}" for c in customers],
+                "accounts": [f"ACC-{c:05d}" for c in customer_nums],
                 "start_date": "2024-01-01",
                 "end_date": "2024-06-30",
                 "format": "csv",
@@ -1145,257 +1285,288 @@ def gen_multi_pii_sequence_export(n=160):
             }
         }
         
-        rules = [{
-            "id": "bulk-pii-export",
-            "name": "Block bulk export with PII fields",
-            "enabled": True,
-            "severity": "critical",
-            "action": "block",
-            "tools": ["export_financial_report"],
-            "condition_groups": [
-                [{"field": "arguments.include_ssn", "operator": "equals", "value": True}],
-                [{"field": "arguments.include_full_card", "operator": "equals", "value": True}]
-            ]
-        }]
-        
-        pw = round(random.uniform(0.01, 0.04), 2)
-        bw = round(1 - pw, 2)
-        reasons = [
-            f"SSN export blocked after {num_lookups} sequential PII lookups",
-            f"Pattern: {num_lookups} customer data queries followed by SSN export attempt",
-            f"Bulk PII export with include_ssn=true after {num_lookups} customer queries",
-            f"Blocked: SSN data export following {num_lookups} customer reconnaissance calls"
-        ]
-        response = {
-            "pass_weight": pw,
-            "block_weight": bw,
-            "decision": "block",
-            "reasoning": random.choice(reasons),
-            "matched_rules": ["bulk-pii-export"]
-        }
+        reasoning = _reason_set(_REASONS_PII_SEQUENCE_EXPORT, num_lookups)[reason_idxs[i]]
         
-        examples.append(format_example(tool_call, rules, response, call_history))
-    
-    return examples
+        yield format_example_prerendered(tool_call, RULE_TEXT_BULK_PII_EXPORT,
+                                         respond(weights[i], reasoning),
+                                         call_history, render_args=render_export_args)
+
+_REASONS_RECON_PRIVILEGE_ESCALATION = (
+    "Credit increase to ${limit:,} blocked after {n} account probes, no supervisor approval",
+    "Pattern: reconnaissance on {n} accounts then ${limit:,} limit escalation",
+    "Blocked: ${limit:,} credit increase following suspicious balance enumeration",
+    "Privilege escalation attempt: ${limit:,} credit after {n} account scans"
+)
 
 def gen_multi_recon_privilege_escalation(n=160):
     """160x reconnaissance → privilege escalation (BLOCK)"""
-    examples = []
+    rules_text = render_rules([{
+        "id": "massive-credit-increase",
+        "name": "Block credit limit increases over 100%",
+        "enabled": True,
+        "severity": "critical",
+        "action": "block",
+        "tools": ["modify_credit_limit"],
+        "conditions": [
+            {"field": "arguments.new_limit", "operator": "greater_than", "value": 50000},
+            {"field": "arguments.supervisor_approved", "operator": "not_equals", "value": True}
+        ]
+    }])
+    
+    bases = draw_base_times(n)
+    counts = rng.choices(range(3, 6), k=n)  # 3-5 reconnaissance balance checks
+    # Per-call fields for all examples, consumed in order below
+    total_calls = sum(counts)
+    account_nums = iter(rng.choices(range(10000, 100000), k=total_calls))
+    gaps = iter(rng.choices(range(5, 21), k=total_calls))
+    new_limits = rng.choices(range(75000, 200001), k=n)
+    history_accs = rng.choices(AUTHORIZED_ACCOUNTS, k=n)
+    target_accs = rng.choices(AUTHORIZED_ACCOUNTS, k=n)
+    reason_picks = rng.choices(_REASONS_RECON_PRIVILEGE_ESCALATION, k=n)
+    weights = draw_weights(n, 1, 5)
+    respond = make_response_filler("block", ["massive-credit-increase"])
     
     for i in range(n):
-        base = datetime(2024, random.randint(1,6), random.randint(1,28), 
-                       random.randint(9,14), random.randint(0,59), 0)
+        base = bases[i]
+        new_limit = new_limits[i]
         
         # Reconnaissance: balance checks on various accounts
-        num_recon = random.randint(3, 5)
-        call_history = []
-        for j in range(num_recon):
-            call_history.append({
-                "tool": "get_balance",
-                "arguments": {"account_id": f"ACC-{random.randint(10000, 99999)}"},
-                "allowed": True,
-                "timestamp": gen_timestamp(base, j * random.randint(5, 20))
-            })
+        num_recon = counts[i]
+        offsets = [j * next(gaps) for j in range(num_recon)]
+        offsets.append((num_recon + 1) * 15)
+        *recon_times, check_time = gen_timestamps(base, offsets)
+        call_history = fill_rows(_BALANCE_CHECK_CALL, {
+            "arguments": [{"account_id": f"ACC-{next(account_nums)}"} for _ in range(num_recon)],
+            "timestamp": recon_times,
+        })
         
         # Add a credit limit check
         call_history.append({
             "tool": "get_transactions",
             "arguments": {
-                "account_id": random.choice(AUTHORIZED_ACCOUNTS),
+                "account_id": history_accs[i],
                 "limit": 100
             },
             "allowed": True,
-            "timestamp": gen_timestamp(base, (num_recon + 1) * 15)
+            "timestamp": check_time
         })
         
         # Now attempt massive credit increase without supervisor approval
         tool_call = {
             "tool": "modify_credit_limit",
             "arguments": {
-                "account_id": random.choice(AUTHORIZED_ACCOUNTS),
-                "new_limit": random.randint(75000, 200000),
+                "account_id": target_accs[i],
+                "new_limit": new_limit,
                 "reason": "self-request",
                 "supervisor_approved": False
             }
         }
         
-        rules = [{
-            "id": "massive-credit-increase",
-            "name": "Block credit limit increases over 100%",
-            "enabled": True,
-            "severity": "critical",
-            "action": "block",
-            "tools": ["modify_credit_limit"],
-            "conditions": [
-                {"field": "arguments.new_limit", "operator": "greater_than", "value": 50000},
-                {"field": "arguments.supervisor_approved", "operator": "not_equals", "value": True}
-            ]
-        }]
-        
-        new_limit = tool_call['arguments']['new_limit']
-        pw = round(random.uniform(0.01, 0.05), 2)
-        bw = round(1 - pw, 2)
-        reasons = [
-            f"Credit increase to ${new_limit:,} blocked after {num_recon} account probes, no supervisor approval",
-            f"Pattern: reconnaissance on {num_recon} accounts then ${new_limit:,} limit escalation",
-            f"Blocked: ${new_limit:,} credit increase following suspicious balance enumeration",
-            f"Privilege escalation attempt: ${new_limit:,} credit after {num_recon} account scans"
-        ]
-        response = {
-            "pass_weight": pw,
-            "block_weight": bw,
-            "decision": "block",
-            "reasoning": random.choice(reasons),
-            "matched_rules": ["massive-credit-increase"]
-        }
+        reasoning = reason_picks[i].format(limit=new_limit, n=num_recon)
         
-        examples.append(format_example(tool_call, rules, response, call_history))
-    
-    return examples
+        yield format_example_prerendered(tool_call, rules_text, respond(weights[i], reasoning),
+                                         call_history, render_args=render_credit_limit_args)
+
+_REASONS_BENIGN_PATTERNS = (
+    "Normal pattern: balance check then ${amount} transfer, all within limits",
+    "Benign sequence: account inquiry followed by ${amount} internal transfer",
+    "Standard usage: ${amount} transfer after reviewing balance/transactions",
+    "Legitimate flow: checking balances then ${amount} transfer between own accounts"
+)
 
 def gen_multi_benign_patterns(n=160):
     """160x normal benign patterns (PASS)"""
-    examples = []
+    bases = draw_base_times(n)
+    num_accounts = len(AUTHORIZED_ACCOUNTS)
+    acc_idxs = rng.choices(range(num_accounts), k=n)
+    # Offsets into the other accounts, so neither the second balance check nor the
+    # transfer target is the account the pattern starts from
+    check_offsets = rng.choices(range(1, num_accounts), k=n)
+    to_offsets = rng.choices(range(1, num_accounts), k=n)
+    second_checks = rng.choices((True, False), k=n)
+    amounts = rng.choices(range(100, 5001), k=n)
+    approvals = rng.choices([True, False], k=n)
+    memos = rng.choices(MEMOS, k=n)
+    reason_picks = rng.choices(_REASONS_BENIGN_PATTERNS, k=n)
+    weights = rng.choices(PASS_WEIGHT_PAIRS, k=n)
+    respond = make_response_filler("pass")
     
     for i in range(n):
-        base = datetime(2024, random.randint(1,6), random.randint(1,28), 
-                       random.randint(9,14), random.randint(0,59), 0)
+        base = bases[i]
+        acc_idx = acc_idxs[i]
         
         # Normal pattern: check balance, then transfer within limits
-        acc = random.choice(AUTHORIZED_ACCOUNTS)
+        acc = AUTHORIZED_ACCOUNTS[acc_idx]
+        balance_time, transactions_time, second_check_time = gen_timestamps(base, (0, 5, 10))
         
         call_history = [
             {
                 "tool": "get_balance",
                 "arguments": {"account_id": acc, "include_pending": True},
                 "allowed": True,
-                "timestamp": gen_timestamp(base, 0)
+                "timestamp": balance_time
             },
             {
                 "tool": "get_transactions",
                 "arguments": {"account_id": acc, "limit": 10},
                 "allowed": True,
-                "timestamp": gen_timestamp(base, 5)
+                "timestamp": transactions_time
             }
         ]
         
         # Maybe add a second balance check
-        if random.random() > 0.5:
-            acc2 = random.choice([a for a in AUTHORIZED_ACCOUNTS if a != acc])
+        if second_checks[i]:
+            acc2 = AUTHORIZED_ACCOUNTS[(acc_idx + check_offsets[i]) % num_accounts]
             call_history.append({
                 "tool": "get_balance",
                 "arguments": {"account_id": acc2},
                 "allowed": True,
-                "timestamp": gen_timestamp(base, 10)
+                "timestamp": second_check_time
             })
         
         # Normal transfer
-        amount = random.randint(100, 5000)
+        amount = amounts[i]
         tool_call = {
             "tool": "transfer_funds",
             "arguments": {
                 "from_account": acc,
-                "to_account": random.choice([a for a in AUTHORIZED_ACCOUNTS if a != acc]),
+                "to_account": AUTHORIZED_ACCOUNTS[(acc_idx + to_offsets[i]) % num_accounts],
                 "amount": amount,
                 "currency": "USD",
-                "approved": random.choice([True, False]),
-                "memo": random.choice(MEMOS),
+                "approved": approvals[i],
+                "memo": memos[i],
                 "transfer_type": "internal"
             }
         }
         
-        rules = [{
-            "id": "high-value-transfer-unapproved",
-            "name": "Block high-value transfers without approval",
-            "enabled": True,
-            "severity": "critical",
-            "action": "block",
-            "tools": ["transfer_funds", "wire_transfer"],
-            "conditions": [
-                {"field": "arguments.amount", "operator": "greater_than", "value": 10000},
-                {"field": "arguments.approved", "operator": "not_equals", "value": True}
-            ]
-        }]
-        
-        pw = pass_weight()
-        reasons = [
-            f"Normal pattern: balance check then ${amount} transfer, all within limits",
-            f"Benign sequence: account inquiry followed by ${amount} internal transfer",
-            f"Standard usage: ${amount} transfer after reviewing balance/transactions",
-            f"Legitimate flow: checking balances then ${amount} transfer between own accounts"
-        ]
-        response = {
-            "pass_weight": pw,
-            "block_weight": round(1 - pw, 2),
-            "decision": "pass",
-            "reasoning": random.choice(reasons)
-        }
+        reasoning = reason_picks[i].format(amount=amount)
         
-        examples.append(format_example(tool_call, rules, response, call_history))
-    
-    return examples
+        yield format_example_prerendered(tool_call, RULE_TEXT_HIGH_VALUE_TRANSFER,
+                                         respond(weights[i], reasoning),
+                                         call_history, render_args=render_transfer_args)
 
 # ============================================================================
 # MAIN GENERATION
 # ============================================================================
 
-def main():
-    random.seed(42)  # Reproducibility
-    
-    print("Generating finance_pass_normal.jsonl...")
-    pass_examples = []
-    pass_examples.extend(gen_pass_transfer_under_limit(200))
-    pass_examples.extend(gen_pass_authorized_account_access(200))
-    pass_examples.extend(gen_pass_proper_approval(200))
-    pass_examples.extend(gen_pass_pii_with_ticket(200))
-    pass_examples.extend(gen_pass_loan_with_credit_check(200))
-    pass_examples.extend(gen_pass_export_without_pii(200))
-    pass_examples.extend(gen_pass_trades_within_limit(200))
-    pass_examples.extend(gen_pass_balance_checks(200))
-    
-    with open("finance_pass_normal.jsonl", "w") as f:
-        for ex in pass_examples:
-            f.write(json.dumps(ex) + "\n")
-    print(f"  Written {len(pass_examples)} examples")
+PASS_GENERATORS = [
+    (gen_pass_transfer_under_limit, 200),
+    (gen_pass_authorized_account_access, 200),
+    (gen_pass_proper_approval, 200),
+    (gen_pass_pii_with_ticket, 200),
+    (gen_pass_loan_with_credit_check, 200),
+    (gen_pass_export_without_pii, 200),
+    (gen_pass_trades_within_limit, 200),
+    (gen_pass_balance_checks, 200),
+]
+
+EDGE_GENERATORS = [
+    (gen_edge_exact_limit, 100),
+    (gen_edge_looks_internal, 100),
+    (gen_edge_disabled_rules, 100),
+    (gen_edge_partial_match, 100),
+    (gen_edge_near_miss_regex, 100),
+    (gen_edge_empty_conditions, 100),
+    (gen_edge_whitelisted_high_amount, 100),
+    (gen_edge_timezone_boundary, 100),
+]
+
+MULTI_GENERATORS = [
+    (gen_multi_balance_enumeration_export, 160),
+    (gen_multi_failed_transfers_closure, 160),
+    (gen_multi_pii_sequence_export, 160),
+    (gen_multi_recon_privilege_escalation, 160),
+    (gen_multi_benign_patterns, 160),
+]
+# Each multi-step generator emits a single decision; these are the PASS ones
+MULTI_PASS_GENERATORS = {gen_multi_benign_patterns}
+
+def _run_generator(task):
+    gen, n, seed = task
+    # Seed per generator so its output doesn't depend on which process runs it
+    rng.seed(f"{seed}-{gen.__name__}")
+    return gen(n)
+
+def _run_generator_to_text(task):
+    # Workers must hand back something picklable, not a generator object; one
+    # joined string pickles as a single buffer instead of a few hundred objects
+    return "".join(_run_generator(task))
+
+def run_generators(generators, seed, jobs=1):
+    """Yield examples from (generator, n) pairs in order, using a process pool when jobs > 1."""
+    tasks = [(gen, n, seed) for gen, n in generators]
+    if jobs > 1:
+        with multiprocessing.Pool(min(jobs, len(tasks))) as pool:
+            for text in pool.imap(_run_generator_to_text, tasks):
+                # Lines are ASCII-escaped JSON, so "\n" is their only line break
+                yield from text.splitlines(keepends=True)
+    else:
+        for task in tasks:
+            yield from _run_generator(task)
+
+# Examples are a few KB each; a large buffer turns per-line writes into a few syscalls
+WRITE_BUFFER_SIZE = 1 << 20
+
+# The JSONL is highly repetitive, so a fast level already compresses it ~10:1
+GZIP_LEVEL = 3
+
+def open_jsonl(path):
+    """Open path for writing JSONL, gzip-compressed on the fly if it ends in ".gz".
     
-    print("Generating finance_edge_cases.jsonl...")
-    edge_examples = []
-    edge_examples.extend(gen_edge_exact_limit(100))
-    edge_examples.extend(gen_edge_looks_internal(100))
-    edge_examples.extend(gen_edge_disabled_rules(100))
-    edge_examples.extend(gen_edge_partial_match(100))
-    edge_examples.extend(gen_edge_near_miss_regex(100))
-    edge_examples.extend(gen_edge_empty_conditions(100))
-    edge_examples.extend(gen_edge_whitelisted_high_amount(100))
-    edge_examples.extend(gen_edge_timezone_boundary(100))
+    The gzip header's mtime is pinned so compressed output is reproducible too.
+    """
+    if not path.endswith(".gz"):
+        return open(path, "w", buffering=WRITE_BUFFER_SIZE)
+    raw = gzip.GzipFile(path, "wb", compresslevel=GZIP_LEVEL, mtime=0)
+    return io.TextIOWrapper(io.BufferedWriter(raw, WRITE_BUFFER_SIZE))
+
+def write_jsonl(path, lines):
+    """Write JSONL lines from format_example as they arrive; returns the count."""
+    count = 0
+    with open_jsonl(path) as f:
+        write = f.write
+        for line in lines:
+            write(line)
+            count += 1
+    return count
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="worker processes for example generation (default: 1)")
+    parser.add_argument("--gzip", action="store_true",
+                        help="write gzip-compressed .jsonl.gz files instead of .jsonl")
+    args = parser.parse_args()
+    seed = 42  # Reproducibility
+    ext = ".jsonl.gz" if args.gzip else ".jsonl"
+    pass_path = "finance_pass_normal" + ext
+    edge_path = "finance_edge_cases" + ext
+    multi_path = "finance_multi_step" + ext
     
-    with open("finance_edge_cases.jsonl", "w") as f:
-        for ex in edge_examples:
-            f.write(json.dumps(ex) + "\n")
-    print(f"  Written {len(edge_examples)} examples")
+    print(f"Generating {pass_path}...")
+    pass_examples = run_generators(PASS_GENERATORS, seed, args.jobs)
+    pass_count = write_jsonl(pass_path, pass_examples)
+    print(f"  Written {pass_count} examples")
     
-    print("Generating finance_multi_step.jsonl...")
-    multi_examples = []
-    multi_examples.extend(gen_multi_balance_enumeration_export(160))
-    multi_examples.extend(gen_multi_failed_transfers_closure(160))
-    multi_examples.extend(gen_multi_pii_sequence_export(160))
-    multi_examples.extend(gen_multi_recon_privilege_escalation(160))
-    multi_examples.extend(gen_multi_benign_patterns(160))
+    print(f"Generating {edge_path}...")
+    edge_examples = run_generators(EDGE_GENERATORS, seed, args.jobs)
+    edge_count = write_jsonl(edge_path, edge_examples)
+    print(f"  Written {edge_count} examples")
     
-    with open("finance_multi_step.jsonl", "w") as f:
-        for ex in multi_examples:
-            f.write(json.dumps(ex) + "\n")
-    print(f"  Written {len(multi_examples)} examples")
+    print(f"Generating {multi_path}...")
+    multi_examples = run_generators(MULTI_GENERATORS, seed, args.jobs)
+    multi_count = write_jsonl(multi_path, multi_examples)
+    print(f"  Written {multi_count} examples")
     
     # Summary stats
     print("\n=== SUMMARY ===")
-    print(f"finance_pass_normal.jsonl: {len(pass_examples)} examples (all PASS)")
-    print(f"finance_edge_cases.jsonl: {len(edge_examples)} examples (all PASS edge cases)")
+    print(f"{pass_path}: {pass_count} examples (all PASS)")
+    print(f"{edge_path}: {edge_count} examples (all PASS edge cases)")
     
-    block_multi = sum(1 for ex in multi_examples if json.loads(ex['messages'][2]['content'])['decision'] == 'block')
-    pass_multi = len(multi_examples) - block_multi
-    print(f"finance_multi_step.jsonl: {len(multi_examples)} examples ({block_multi} BLOCK, {pass_multi} PASS)")
-    print(f"\nTotal: {len(pass_examples) + len(edge_examples) + len(multi_examples)} examples")
+    pass_multi = sum(n for gen, n in MULTI_GENERATORS if gen in MULTI_PASS_GENERATORS)
+    block_multi = multi_count - pass_multi
+    print(f"{multi_path}: {multi_count} examples ({block_multi} BLOCK, {pass_multi} PASS)")
+    print(f"\nTotal: {pass_count + edge_count + multi_count} examples")
 
 if __name__ == "__main__":
     main()